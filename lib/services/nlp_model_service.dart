@@ -1,5 +1,6 @@
 import 'dart:convert';
 import 'dart:math';
+import 'dart:typed_data';
 import 'package:flutter/foundation.dart';
 import 'package:flutter/services.dart';
 import 'package:tflite_flutter/tflite_flutter.dart' 
@@ -11,6 +12,8 @@ import 'package:tflite_flutter/tflite_flutter.dart'
 class NLPModelService {
   static NLPModelService? _instance;
   Interpreter? _interpreter;
+  Int8List? _embeddingTable;
+  Float32List? _embeddingScales;
   Map<String, int>? _wordToIndex;
   Map<int, String>? _indexToWord;
   List<Map<String, dynamic>>? _metadata;
@@ -18,6 +21,14 @@ class NLPModelService {
   bool _isLoaded = false;
   bool _similarityLoaded = false;
 
+  static const int _embeddingDim = 100;
+
+  /// Dynamic-range TFLite build, the default model
+  static const String defaultModelAsset = 'assets/models/bisaya_model.tflite';
+
+  /// Float16 TFLite build (near-lossless, suited to GPU delegates)
+  static const String fp16ModelAsset = 'assets/models/bisaya_model_fp16.tflite';
+
   NLPModelService._();
 
   /// Get singleton instance
@@ -27,28 +38,57 @@ class NLPModelService {
   }
 
   /// Load the trained TensorFlow Lite model from assets
-  Future<void> loadModel() async {
+  ///
+  /// [modelAsset] picks the TFLite build, e.g. [fp16ModelAsset]; when it is not
+  /// bundled the default model is used instead.
+  Future<void> loadModel({String modelAsset = defaultModelAsset}) async {
     if (_isLoaded) return;
 
     try {
       // Load TensorFlow Lite model (skip on web - not supported)
       if (!kIsWeb) {
-        try {
-          final interpreterOptions = InterpreterOptions();
-          _interpreter = await Interpreter.fromAsset(
-            'assets/models/bisaya_model.tflite',
-            options: interpreterOptions,
-          );
-          
-          debugPrint('✅ TensorFlow Lite model loaded');
-        } catch (e) {
-          debugPrint('⚠️ TensorFlow Lite model not found, continuing with metadata only: $e');
+        final modelAssets = {modelAsset, defaultModelAsset};
+        for (final asset in modelAssets) {
+          try {
+            final interpreterOptions = InterpreterOptions();
+            _interpreter = await Interpreter.fromAsset(
+              asset,
+              options: interpreterOptions,
+            );
+
+            debugPrint('✅ TensorFlow Lite model loaded: $asset');
+            break;
+          } catch (e) {
+            debugPrint('⚠️ TensorFlow Lite model $asset not found: $e');
+          }
+        }
+        if (_interpreter == null) {
+          debugPrint('⚠️ Continuing with metadata only');
           // Continue without TFLite model - we can still use metadata
         }
       } else {
         debugPrint('⚠️ TensorFlow Lite not supported on web, using metadata only');
       }
 
+      // Load the raw int8 embedding table (also works on web, where TFLite is unavailable)
+      try {
+        final table = await rootBundle.load('assets/models/bisaya_embeddings.bin');
+        final scales = await rootBundle.load('assets/models/bisaya_embedding_scales.bin');
+        final rowCount = scales.lengthInBytes ~/ 4;
+        if (table.lengthInBytes == rowCount * _embeddingDim) {
+          _embeddingTable = table.buffer.asInt8List(table.offsetInBytes, table.lengthInBytes);
+          _embeddingScales = Float32List(rowCount);
+          for (var i = 0; i < rowCount; i++) {
+            _embeddingScales![i] = scales.getFloat32(i * 4, Endian.little);
+          }
+          debugPrint('✅ Embedding table loaded: $rowCount rows');
+        } else {
+          debugPrint('⚠️ Embedding table size mismatch, using TensorFlow Lite model');
+        }
+      } catch (e) {
+        debugPrint('⚠️ Embedding table not found, using TensorFlow Lite model: $e');
+      }
+
       // Load metadata JSON
       try {
         final String metadataString = await rootBundle.loadString('assets/models/bisaya_metadata.json');
@@ -85,7 +125,7 @@ class NLPModelService {
   /// Check if model is loaded
   bool get isLoaded => _isLoaded;
 
-  /// Get embedding for a word using TensorFlow Lite model
+  /// Get embedding for a word from the int8 embedding table, falling back to the TensorFlow Lite model
   List<double>? getEmbedding(String word) {
     _ensureLoaded();
     final wordLower = word.toLowerCase();
@@ -94,13 +134,23 @@ class NLPModelService {
       return null;
     }
     
+    final wordIndex = _wordToIndex![wordLower]!;
+    
+    // Prefer the raw embedding table: dequantizing one row is cheaper than an interpreter call
+    final table = _embeddingTable;
+    final scales = _embeddingScales;
+    if (table != null && scales != null && wordIndex < scales.length) {
+      final scale = scales[wordIndex];
+      final offset = wordIndex * _embeddingDim;
+      return List<double>.generate(_embeddingDim, (i) => table[offset + i] * scale);
+    }
+    
     // If TFLite model is not available, return null
     if (_interpreter == null) {
       return null;
     }
     
     try {
-      final wordIndex = _wordToIndex![wordLower]!;
       // Input: single integer index [wordIndex]
       final input = [wordIndex];
       // Output: 100-dimensional embedding vector
@@ -447,6 +497,8 @@ class NLPModelService {
   void dispose() {
     _interpreter?.close();
     _interpreter = null;
+    _embeddingTable = null;
+    _embeddingScales = null;
     _isLoaded = false;
   }
 }
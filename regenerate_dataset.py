@@ -6,383 +6,819 @@ Reads from bisaya_metadata.json and generates appropriate examples for each word
 
 import json
 import csv
+import functools
+import io
+import itertools
 import os
 import re
-from typing import Dict, List, Tuple
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 def load_metadata(json_path: str) -> List[Dict]:
     """Load word metadata from JSON file."""
-    with open(json_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    if ORJSON_AVAILABLE:
+        # orjson decodes straight from UTF-8 bytes, several times faster than json
+        with open(json_path, 'rb') as f:
+            data = orjson.loads(f.read())
+    else:
+        with open(json_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
     return data.get('metadata', [])
 
+# Common verb prefixes, longest first so 'maka-' is not cut short by 'maka'
+VERB_PREFIX_PATTERN = re.compile(r'^(?:maka-|maka|nag|mag|mo|gi|na|ka)')
+
 def get_base_form(word: str) -> str:
     """Get base form of verb by removing common prefixes."""
-    prefixes = ['mo', 'nag', 'gi', 'mag', 'na', 'ka', 'maka', 'maka-']
     word_lower = word.lower()
-    for prefix in prefixes:
-        if word_lower.startswith(prefix):
-            return word_lower[len(prefix):]
-    return word_lower
+    match = VERB_PREFIX_PATTERN.match(word_lower)
+    return word_lower[match.end():] if match else word_lower
+
+IRREGULAR_PAST = {
+    'go': 'went', 'eat': 'ate', 'buy': 'bought', 'read': 'read', 'write': 'wrote',
+    'run': 'ran', 'sleep': 'slept', 'drink': 'drank', 'sit': 'sat', 'stand': 'stood',
+    'speak': 'spoke', 'sing': 'sang', 'sell': 'sold', 'give': 'gave', 'get': 'got',
+    'put': 'put', 'come': 'came', 'see': 'saw', 'tell': 'told', 'take': 'took',
+    'wake': 'woke', 'fall': 'fell', 'lie': 'lay',
+}
+# Regular endings: consonant + 'y' (cry -> cried), final 'e' (use -> used), or a
+# one-vowel stem whose final consonant doubles (stop -> stopped)
+PAST_TENSE_PATTERN = re.compile(
+    r'^(?:(?P<y_stem>.*[^aeiou])y|(?P<e_stem>.*e)|[^aeiou]*[aeiou](?P<final>[^aeiouwxy]))$'
+)
+
+def _word_past_tense(verb: str) -> str:
+    """Get simple past tense of a single lowercase English verb."""
+    if verb in IRREGULAR_PAST:
+        return IRREGULAR_PAST[verb]
+    match = PAST_TENSE_PATTERN.match(verb)
+    if match is None:
+        return verb + 'ed'
+    if match['y_stem'] is not None:
+        return match['y_stem'] + 'ied'
+    if match['e_stem'] is not None:
+        return verb + 'd'
+    return verb + match['final'] + 'ed'
+
+def get_past_tense(verb: str) -> str:
+    """Get simple past tense of a lowercase English verb or verb phrase.
+
+    Only the head verb is inflected (wake up -> woke up), and a head already in
+    the past is kept (cooked rice); a leading 'will' drops out, since the
+    templates put the phrase in the past (will sell -> sold), and so does the
+    infinitive 'to' of a gloss (to eat -> ate).
+    """
+    words = verb.split()
+    if len(words) > 1 and words[0] in ('will', 'to'):
+        words = words[1:]
+    if len(words) <= 1:
+        return _word_past_tense(words[0] if words else verb)
+    head = words[0]
+    if not head.endswith('ed'):
+        head = _word_past_tense(head)
+    return ' '.join([head] + words[1:])
+
+# Substring triggers checked by the example branches in generate_examples.
+BISAYA_TRIGGERS = (
+    'kumusta', 'maayong', 'salamat', 'palihug', 'pasaylo',
+    'kaon', 'tulog', 'basa', 'sulat', 'palit', 'lakaw', 'dagan', 'adto',
+    'tubig', 'pagkaon', 'balay', 'libro', 'amahan', 'inahan', 'adlaw', 'bulan',
+    'wala', 'daghan', 'maayo', 'gwapa', 'gwapo', 'dako', 'gamay', 'init', 'bugnaw',
+    'tibuok', 'bahin', 'bag-o', 'karaan', 'taas', 'mubo', 'lapad',
+    'karon', 'ugma', 'gahapon', 'asa', 'unsa', 'kanus-a', 'ngano',
+)
+ENGLISH_TRIGGERS = (
+    'eat', 'sleep', 'read', 'write', 'buy', 'walk', 'run', 'go',
+    'water', 'food', 'house', 'book', 'father', 'mother', 'day', 'sun', 'month', 'moon',
+    'none', 'nothing', 'many', 'much', 'good', 'beautiful', 'female', 'handsome', 'big',
+    'small', 'hot', 'cold', 'whole', 'complete', 'part', 'new', 'old', 'tall', 'high',
+    'short', 'low', 'wide', 'one', 'two', 'now', 'tomorrow', 'yesterday',
+    'where', 'what', 'when', 'why',
+)
+
+def build_trigger_scanner(triggers: Tuple[str, ...]) -> Tuple[re.Pattern, Dict[str, frozenset]]:
+    """Compile triggers into one regex that finds all of them in a single pass."""
+    # Longest first so the lookahead reports the longest trigger at each offset
+    ordered = sorted(set(triggers), key=len, reverse=True)
+    pattern = re.compile('(?=(' + '|'.join(re.escape(t) for t in ordered) + '))')
+    # Shorter triggers starting at the same offset ('maayo' in 'maayong')
+    prefixes = {t: frozenset(p for p in ordered if t.startswith(p)) for t in ordered}
+    return pattern, prefixes
+
+def scan_triggers(text: str, scanner: Tuple[re.Pattern, Dict[str, frozenset]]) -> frozenset:
+    """Return the set of triggers that occur anywhere in text."""
+    pattern, prefixes = scanner
+    hits = set()
+    for match in pattern.finditer(text):
+        hits.update(prefixes[match.group(1)])
+    return frozenset(hits)
+
+BISAYA_SCANNER = build_trigger_scanner(BISAYA_TRIGGERS)
+ENGLISH_SCANNER = build_trigger_scanner(ENGLISH_TRIGGERS)
+
+# Whole Bisaya words that place a word in a POS branch regardless of its tagged POS
+VERB_WORDS = frozenset({'mokaon', 'matulog', 'mobasa', 'mosulat', 'mopalit'})
+NUMBER_WORDS = frozenset({'usa', 'duha', 'tulo', 'upat', 'lima'})
+TIME_WORDS = frozenset({'karon', 'ugma', 'gahapon', 'adlaw'})
+QUESTION_WORDS = frozenset({'asa', 'unsa', 'kamus-a', 'ngano'})
+
+class TemplateRule(NamedTuple):
+    """Trigger conditions that select a row of pre-built example templates."""
+    key: str
+    bisaya: Tuple[str, ...] = ()       # any of these occurs in the Bisaya word
+    english: Tuple[str, ...] = ()      # any of these occurs in the English meaning
+    english_all: Tuple[str, ...] = ()  # all of these occur in the English meaning
+    exact: Tuple[str, ...] = ()        # the Bisaya word is exactly one of these
+
+def match_template(rules: Tuple[TemplateRule, ...], bisaya_lower: str, bisaya_hits: frozenset, english_hits: frozenset) -> Optional[str]:
+    """Return the key of the first rule whose conditions hold, in rule order."""
+    for rule in rules:
+        if (not bisaya_hits.isdisjoint(rule.bisaya)
+                or not english_hits.isdisjoint(rule.english)
+                or (rule.english_all and english_hits.issuperset(rule.english_all))
+                or bisaya_lower in rule.exact):
+            return rule.key
+    return None
+
+# Rules are checked in order; the first match picks the templates by key.
+GREETING_RULES = (
+    TemplateRule('kumusta', bisaya=('kumusta',)),
+    TemplateRule('maayong', bisaya=('maayong',)),
+    TemplateRule('salamat', bisaya=('salamat',)),
+    TemplateRule('palihug', bisaya=('palihug',)),
+    TemplateRule('pasaylo', bisaya=('pasaylo',)),
+    TemplateRule('oo', exact=('oo',)),
+    TemplateRule('dili', exact=('dili',)),
+)
+VERB_RULES = (
+    TemplateRule('kaon', bisaya=('kaon',), english=('eat',)),
+    TemplateRule('tulog', bisaya=('tulog',), english=('sleep',)),
+    TemplateRule('basa', bisaya=('basa',), english=('read',)),
+    TemplateRule('sulat', bisaya=('sulat',), english=('write',)),
+    TemplateRule('palit', bisaya=('palit',), english=('buy',)),
+    TemplateRule('lakaw', bisaya=('lakaw',), english=('walk',)),
+    TemplateRule('dagan', bisaya=('dagan',), english=('run',)),
+    TemplateRule('adto', bisaya=('adto',), english=('go',)),
+)
+NOUN_RULES = (
+    TemplateRule('tubig', bisaya=('tubig',), english=('water',)),
+    TemplateRule('pagkaon', bisaya=('pagkaon',), english=('food',)),
+    TemplateRule('balay', bisaya=('balay',), english=('house',)),
+    TemplateRule('libro', bisaya=('libro',), english=('book',)),
+    TemplateRule('amahan', bisaya=('amahan',), english=('father',)),
+    TemplateRule('inahan', bisaya=('inahan',), english=('mother',)),
+    TemplateRule('adlaw', bisaya=('adlaw',), english_all=('day', 'sun')),
+    TemplateRule('bulan', bisaya=('bulan',), english_all=('month', 'moon')),
+)
+ADJECTIVE_RULES = (
+    TemplateRule('wala', bisaya=('wala',), english=('none', 'nothing')),
+    TemplateRule('daghan', bisaya=('daghan',), english=('many', 'much')),
+    TemplateRule('maayo', bisaya=('maayo',), english=('good',)),
+    TemplateRule('gwapa', bisaya=('gwapa',), english_all=('beautiful', 'female')),
+    TemplateRule('gwapo', bisaya=('gwapo',), english=('handsome',)),
+    TemplateRule('dako', bisaya=('dako',), english=('big',)),
+    TemplateRule('gamay', bisaya=('gamay',), english=('small',)),
+    TemplateRule('init', bisaya=('init',), english=('hot',)),
+    TemplateRule('bugnaw', bisaya=('bugnaw',), english=('cold',)),
+    TemplateRule('tibuok', bisaya=('tibuok',), english=('whole', 'complete')),
+    TemplateRule('bahin', bisaya=('bahin',), english=('part',)),
+    TemplateRule('bag-o', bisaya=('bag-o',), english=('new',)),
+    TemplateRule('karaan', bisaya=('karaan',), english=('old',)),
+    TemplateRule('taas', bisaya=('taas',), english=('tall', 'high')),
+    TemplateRule('mubo', bisaya=('mubo',), english=('short', 'low')),
+    TemplateRule('lapad', bisaya=('lapad',), english=('wide',)),
+)
+NUMBER_RULES = (
+    TemplateRule('usa', english=('one',), exact=('usa',)),
+    TemplateRule('duha', english=('two',), exact=('duha',)),
+)
+TIME_RULES = (
+    TemplateRule('karon', bisaya=('karon',), english=('now',)),
+    TemplateRule('ugma', bisaya=('ugma',), english=('tomorrow',)),
+    TemplateRule('gahapon', bisaya=('gahapon',), english=('yesterday',)),
+)
+QUESTION_RULES = (
+    TemplateRule('asa', bisaya=('asa',), english=('where',)),
+    TemplateRule('unsa', bisaya=('unsa',), english=('what',)),
+    TemplateRule('kanus-a', bisaya=('kanus-a',), english=('when',)),
+    TemplateRule('ngano', bisaya=('ngano',), english=('why',)),
+)
+
+# (beginner, intermediate, advanced) examples, each (bisaya, english, tagalog)
+GREETING_TEMPLATES = {
+    'kumusta': (
+        ('Kumusta ka?', 'How are you?', 'Kumusta ka?'),
+        ('Kumusta na ka karon?', 'How are you now?', 'Kumusta ka na ngayon?'),
+        ('Kumusta na ka? Maayo ra ba?', 'How are you? Are you doing well?', 'Kumusta ka na? Mabuti ba?'),
+    ),
+    'salamat': (
+        ('Salamat.', 'Thank you.', 'Salamat.'),
+        ('Daghang salamat sa imong tabang.', 'Thank you very much for your help.', 'Maraming salamat sa iyong tulong.'),
+        ('Daghang salamat kaayo sa tanan nga imong nahimo.', 'Thank you very much for everything you did.', 'Maraming salamat sa lahat ng iyong ginawa.'),
+    ),
+    'palihug': (
+        ('Palihug.', 'Please.', 'Pakiusap.'),
+        ('Palihug, tabangi ko.', 'Please, help me.', 'Pakiusap, tulungan mo ako.'),
+        ('Palihug, mahimo ba nimo ko tabangan karon?', 'Please, can you help me now?', 'Pakiusap, maaari mo ba akong tulungan ngayon?'),
+    ),
+    'pasaylo': (
+        ('Pasaylo.', 'Sorry.', 'Paumanhin.'),
+        ('Pasaylo sa akong nahimo.', 'Sorry for what I did.', 'Paumanhin sa aking ginawa.'),
+        ('Pasaylo kaayo sa tanan nga kasaypanan.', 'I am very sorry for all the mistakes.', 'Paumanhin sa lahat ng pagkakamali.'),
+    ),
+    'oo': (
+        ('Oo.', 'Yes.', 'Oo.'),
+        ('Oo, gusto ko.', 'Yes, I want to.', 'Oo, gusto ko.'),
+        ('Oo, sigurado ko nga gusto ko.', 'Yes, I am sure I want to.', 'Oo, sigurado ako na gusto ko.'),
+    ),
+    'dili': (
+        ('Dili.', 'No.', 'Hindi.'),
+        ('Dili ko gusto.', 'I don\'t want to.', 'Ayaw ko.'),
+        ('Dili ko gusto nga moadto didto.', 'I don\'t want to go there.', 'Ayaw kong pumunta doon.'),
+    ),
+}
+VERB_TEMPLATES = {
+    'kaon': (
+        ('Gusto ko mokaon.', 'I want to eat.', 'Gusto kong kumain.'),
+        ('Nakaon na ba ka?', 'Have you eaten already?', 'Kumain ka na ba?'),
+        ('Gikaon nako ang tinapay ganina.', 'I ate the bread earlier.', 'Kumain ako ng tinapay kanina.'),
+    ),
+    'tulog': (
+        ('Gusto ko matulog.', 'I want to sleep.', 'Gusto kong matulog.'),
+        ('Natulog na ba ka?', 'Have you slept already?', 'Natulog ka na ba?'),
+        ('Kinahanglan nga matulog ka aron makapahuway.', 'You need to sleep to rest.', 'Kailangan mong matulog para makapahinga.'),
+    ),
+    'basa': (
+        ('Gusto ko mobasa.', 'I want to read.', 'Gusto kong magbasa.'),
+        ('Nagbasa ko ug libro.', 'I am reading a book.', 'Nagbabasa ako ng libro.'),
+        ('Gibasa nako ang libro ganina.', 'I read the book earlier.', 'Binasa ko ang libro kanina.'),
+    ),
+    'sulat': (
+        ('Gusto ko mosulat.', 'I want to write.', 'Gusto kong sumulat.'),
+        ('Nagsulat ko ug sulat.', 'I am writing a letter.', 'Nagsusulat ako ng sulat.'),
+        ('Gisulat nako ang sulat kagahapon.', 'I wrote the letter yesterday.', 'Sinulat ko ang sulat kahapon.'),
+    ),
+    'palit': (
+        ('Gusto ko mopalit.', 'I want to buy.', 'Gusto kong bumili.'),
+        ('Mopalit ko ug tinapay.', 'I will buy bread.', 'Bibili ako ng tinapay.'),
+        ('Gipalit nako ang tinapay sa tindahan.', 'I bought the bread at the store.', 'Binili ko ang tinapay sa tindahan.'),
+    ),
+    'lakaw': (
+        ('Gusto ko molakaw.', 'I want to walk.', 'Gusto kong maglakad.'),
+        ('Naglakaw ko sa dalan.', 'I am walking on the road.', 'Naglalakad ako sa kalsada.'),
+        ('Naglakaw ko gikan sa balay padulong sa eskwelahan.', 'I walked from home to school.', 'Naglalakad ako mula sa bahay papunta sa paaralan.'),
+    ),
+    'dagan': (
+        ('Gusto ko modagan.', 'I want to run.', 'Gusto kong tumakbo.'),
+        ('Nagdagan ko sa parke.', 'I am running in the park.', 'Tumatakbo ako sa parke.'),
+        ('Nagdagan ko aron makab-ot ang bus.', 'I ran to catch the bus.', 'Tumakbo ako para mahabol ang bus.'),
+    ),
+    'adto': (
+        ('Moadto ko.', 'I will go.', 'Pupunta ako.'),
+        ('Moadto ko sa balay.', 'I will go to the house.', 'Pupunta ako sa bahay.'),
+        ('Moadto ko sa balay sa akong higala.', 'I will go to my friend\'s house.', 'Pupunta ako sa bahay ng aking kaibigan.'),
+    ),
+}
+NOUN_TEMPLATES = {
+    'tubig': (
+        ('Gusto ko ug tubig.', 'I want water.', 'Gusto ko ng tubig.'),
+        ('Naa koy tubig sa balay.', 'I have water at home.', 'May tubig ako sa bahay.'),
+        ('Gipalit nako ang tubig sa tindahan.', 'I bought the water at the store.', 'Binili ko ang tubig sa tindahan.'),
+    ),
+    'pagkaon': (
+        ('Gusto ko ug pagkaon.', 'I want food.', 'Gusto ko ng pagkain.'),
+        ('Naa koy pagkaon sa lamesa.', 'I have food on the table.', 'May pagkain ako sa mesa.'),
+        ('Gipangandam nako ang pagkaon para sa tanan.', 'I prepared the food for everyone.', 'Inihanda ko ang pagkain para sa lahat.'),
+    ),
+    'balay': (
+        ('Naa koy balay.', 'I have a house.', 'May bahay ako.'),
+        ('Ang balay kay dako.', 'The house is big.', 'Malaki ang bahay.'),
+        ('Ang balay nga gipalit nako kay nindot kaayo.', 'The house I bought is very beautiful.', 'Ang bahay na binili ko ay napakaganda.'),
+    ),
+    'libro': (
+        ('Naa koy libro.', 'I have a book.', 'May libro ako.'),
+        ('Nagbasa ko ug libro.', 'I am reading a book.', 'Nagbabasa ako ng libro.'),
+        ('Ang libro nga gibasa nako kay nindot kaayo.', 'The book I read is very beautiful.', 'Ang libro na binasa ko ay napakaganda.'),
+    ),
+    'amahan': (
+        ('Siya ang akong amahan.', 'He is my father.', 'Siya ang aking ama.'),
+        ('Ang akong amahan kay maayo kaayo.', 'My father is very good.', 'Ang aking ama ay napakabuti.'),
+        ('Ang akong amahan nga nagtrabaho sa opisina kay kusgan kaayo.', 'My father who works at the office is very strong.', 'Ang aking ama na nagtatrabaho sa opisina ay napakalakas.'),
+    ),
+    'inahan': (
+        ('Siya ang akong inahan.', 'She is my mother.', 'Siya ang aking ina.'),
+        ('Ang akong inahan kay gwapa kaayo.', 'My mother is very beautiful.', 'Ang aking ina ay napakaganda.'),
+        ('Ang akong inahan nga nagluto sa kusina kay maayo kaayo.', 'My mother who cooks in the kitchen is very good.', 'Ang aking ina na nagluluto sa kusina ay napakabuti.'),
+    ),
+    'adlaw': (
+        ('Maayong adlaw.', 'Good day.', 'Magandang araw.'),
+        ('Init kaayo ang adlaw karon.', 'The sun is very hot today.', 'Napakainit ng araw ngayon.'),
+        ('Ang adlaw nga nag-init sa balay kay init kaayo.', 'The sun that heats the house is very hot.', 'Ang araw na nagpapainit sa bahay ay napakainit.'),
+    ),
+    'bulan': (
+        ('Maayong bulan.', 'Good month.', 'Magandang buwan.'),
+        ('Nindot kaayo ang bulan karon.', 'The moon is very beautiful tonight.', 'Napakaganda ng buwan ngayon.'),
+        ('Ang bulan nga nagdan-ag sa dalan kay nindot kaayo.', 'The moon that lights the road is very beautiful.', 'Ang buwan na nagliliwanag sa kalsada ay napakaganda.'),
+    ),
+}
+ADJECTIVE_TEMPLATES = {
+    'wala': (
+        ('Wala ko.', 'I have nothing.', 'Wala ako.'),
+        ('Wala koy kwarta.', 'I have no money.', 'Wala akong pera.'),
+        ('Wala koy kwarta nga magasto karon.', 'I have no money to spend now.', 'Wala akong pera na magagastos ngayon.'),
+    ),
+    'daghan': (
+        ('Daghan kaayo.', 'A lot.', 'Marami.'),
+        ('Daghan kaayo ang tawo.', 'There are many people.', 'Maraming tao.'),
+        ('Daghan kaayo ang tawo nga nakaon sa restaurant.', 'There are many people eating at the restaurant.', 'Maraming tao na kumakain sa restaurant.'),
+    ),
+    'maayo': (
+        ('Maayo kaayo.', 'Very good.', 'Napakabuti.'),
+        ('Ang pagkaon kay maayo kaayo.', 'The food is very good.', 'Napakasarap ng pagkain.'),
+        ('Ang pagkaon nga gipangandam nako kay maayo kaayo sa tanan.', 'The food I prepared is very good for everyone.', 'Ang pagkain na inihanda ko ay napakasarap para sa lahat.'),
+    ),
+    'gwapa': (
+        ('Gwapa kaayo.', 'Very beautiful.', 'Napakaganda.'),
+        ('Ang babaye kay gwapa kaayo.', 'The woman is very beautiful.', 'Napakaganda ng babae.'),
+        ('Ang babaye nga naglakaw sa dalan kay gwapa kaayo.', 'The woman walking on the road is very beautiful.', 'Ang babae na naglalakad sa kalsada ay napakaganda.'),
+    ),
+    'gwapo': (
+        ('Gwapo kaayo.', 'Very handsome.', 'Napakagwapo.'),
+        ('Ang lalaki kay gwapo kaayo.', 'The man is very handsome.', 'Napakagwapo ng lalaki.'),
+        ('Ang lalaki nga naglakaw sa dalan kay gwapo kaayo.', 'The man walking on the road is very handsome.', 'Ang lalaki na naglalakad sa kalsada ay napakagwapo.'),
+    ),
+    'dako': (
+        ('Dako kaayo.', 'Very big.', 'Napakalaki.'),
+        ('Ang balay kay dako kaayo.', 'The house is very big.', 'Napakalaki ng bahay.'),
+        ('Ang balay nga gipalit nako kay dako kaayo ug nindot.', 'The house I bought is very big and beautiful.', 'Ang bahay na binili ko ay napakalaki at napakaganda.'),
+    ),
+    'gamay': (
+        ('Gamay kaayo.', 'Very small.', 'Napakaliit.'),
+        ('Ang bata kay gamay kaayo.', 'The child is very small.', 'Napakaliit ng bata.'),
+        ('Ang bata nga nagdula sa parke kay gamay kaayo.', 'The child playing in the park is very small.', 'Ang bata na naglalaro sa parke ay napakaliit.'),
+    ),
+    'init': (
+        ('Init kaayo.', 'Very hot.', 'Napakainit.'),
+        ('Ang tubig kay init kaayo.', 'The water is very hot.', 'Napakainit ng tubig.'),
+        ('Ang tubig nga gipainit nako kay init kaayo karon.', 'The water I heated is very hot now.', 'Ang tubig na pinainit ko ay napakainit ngayon.'),
+    ),
+    'bugnaw': (
+        ('Bugnaw kaayo.', 'Very cold.', 'Napakalamig.'),
+        ('Ang tubig kay bugnaw kaayo.', 'The water is very cold.', 'Napakalamig ng tubig.'),
+        ('Ang tubig nga gikan sa gripo kay bugnaw kaayo.', 'The water from the faucet is very cold.', 'Ang tubig na galing sa gripo ay napakalamig.'),
+    ),
+    'tibuok': (
+        ('Tibuok ang libro.', 'The whole book.', 'Buong libro.'),
+        ('Gibasa nako ang tibuok nga libro.', 'I read the whole book.', 'Binasa ko ang buong libro.'),
+        ('Gibasa nako ang tibuok nga libro sulod sa usa ka adlaw.', 'I read the whole book within one day.', 'Binasa ko ang buong libro sa loob ng isang araw.'),
+    ),
+    'bahin': (
+        ('Bahin lang.', 'Just a part.', 'Bahagi lang.'),
+        ('Gibasa nako ang bahin sa libro.', 'I read part of the book.', 'Binasa ko ang bahagi ng libro.'),
+        ('Gibasa nako ang bahin sa libro nga importante.', 'I read the important part of the book.', 'Binasa ko ang mahalagang bahagi ng libro.'),
+    ),
+    'bag-o': (
+        ('Bag-o kaayo.', 'Very new.', 'Napakabago.'),
+        ('Ang libro kay bag-o kaayo.', 'The book is very new.', 'Napakabago ng libro.'),
+        ('Ang libro nga gipalit nako kay bag-o kaayo ug nindot.', 'The book I bought is very new and beautiful.', 'Ang libro na binili ko ay napakabago at napakaganda.'),
+    ),
+    'karaan': (
+        ('Karaan kaayo.', 'Very old.', 'Napakaluma.'),
+        ('Ang libro kay karaan kaayo.', 'The book is very old.', 'Napakaluma ng libro.'),
+        ('Ang libro nga gikan sa library kay karaan kaayo.', 'The book from the library is very old.', 'Ang libro na galing sa library ay napakaluma.'),
+    ),
+    'taas': (
+        ('Taas kaayo.', 'Very tall.', 'Napakataas.'),
+        ('Ang tawo kay taas kaayo.', 'The person is very tall.', 'Napakataas ng tao.'),
+        ('Ang tawo nga naglakaw sa dalan kay taas kaayo.', 'The person walking on the road is very tall.', 'Ang tao na naglalakad sa kalsada ay napakataas.'),
+    ),
+    'mubo': (
+        ('Mubo kaayo.', 'Very short.', 'Napakababa.'),
+        ('Ang tawo kay mubo kaayo.', 'The person is very short.', 'Napakababa ng tao.'),
+        ('Ang tawo nga naglakaw sa dalan kay mubo kaayo.', 'The person walking on the road is very short.', 'Ang tao na naglalakad sa kalsada ay napakababa.'),
+    ),
+    'lapad': (
+        ('Lapad kaayo.', 'Very wide.', 'Napakalapad.'),
+        ('Ang dalan kay lapad kaayo.', 'The road is very wide.', 'Napakalapad ng kalsada.'),
+        ('Ang dalan nga gipangita nako kay lapad kaayo.', 'The road I am looking for is very wide.', 'Ang kalsada na hinahanap ko ay napakalapad.'),
+    ),
+}
+NUMBER_TEMPLATES = {
+    'usa': (
+        ('Naa koy usa ka libro.', 'I have one book.', 'May isang libro ako.'),
+        ('Gusto ko ug usa ka libro.', 'I want one book.', 'Gusto ko ng isang libro.'),
+        ('Gipalit nako ang usa ka libro sa tindahan.', 'I bought one book at the store.', 'Binili ko ang isang libro sa tindahan.'),
+    ),
+    'duha': (
+        ('Naa koy duha ka libro.', 'I have two books.', 'May dalawang libro ako.'),
+        ('Gusto ko ug duha ka libro.', 'I want two books.', 'Gusto ko ng dalawang libro.'),
+        ('Gipalit nako ang duha ka libro sa tindahan.', 'I bought two books at the store.', 'Binili ko ang dalawang libro sa tindahan.'),
+    ),
+}
+TIME_TEMPLATES = {
+    'karon': (
+        ('Karon ko moadto.', 'I will go now.', 'Pupunta ako ngayon.'),
+        ('Karon nga adlaw, moadto ko.', 'Today, I will go.', 'Ngayon, pupunta ako.'),
+        ('Karon nga adlaw, moadto ko sa balay sa akong higala.', 'Today, I will go to my friend\'s house.', 'Ngayon, pupunta ako sa bahay ng aking kaibigan.'),
+    ),
+    'ugma': (
+        ('Ugma ko moadto.', 'I will go tomorrow.', 'Pupunta ako bukas.'),
+        ('Ugma, moadto ko sa balay.', 'Tomorrow, I will go to the house.', 'Bukas, pupunta ako sa bahay.'),
+        ('Ugma, moadto ko sa balay sa akong higala aron magdula.', 'Tomorrow, I will go to my friend\'s house to play.', 'Bukas, pupunta ako sa bahay ng aking kaibigan para maglaro.'),
+    ),
+    'gahapon': (
+        ('Gahapon ko moadto.', 'I went yesterday.', 'Pumunta ako kahapon.'),
+        ('Gahapon, nakaon ko sa balay.', 'Yesterday, I ate at home.', 'Kahapon, kumain ako sa bahay.'),
+        ('Gahapon, nakaon ko sa balay sa akong higala ug nagdula mi.', 'Yesterday, I ate at my friend\'s house and we played.', 'Kahapon, kumain ako sa bahay ng aking kaibigan at naglaro kami.'),
+    ),
+}
+QUESTION_TEMPLATES = {
+    'asa': (
+        ('Asa ka?', 'Where are you?', 'Nasaan ka?'),
+        ('Asa ka moadto?', 'Where are you going?', 'Saan ka pupunta?'),
+        ('Asa ka moadto karon nga adlaw?', 'Where are you going today?', 'Saan ka pupunta ngayon?'),
+    ),
+    'unsa': (
+        ('Unsa ni?', 'What is this?', 'Ano ito?'),
+        ('Unsa ang imong gusto?', 'What do you want?', 'Ano ang gusto mo?'),
+        ('Unsa ang imong gusto nga mokaon karon?', 'What do you want to eat now?', 'Ano ang gusto mong kainin ngayon?'),
+    ),
+    'kanus-a': (
+        ('Kanus-a ka moadto?', 'When will you go?', 'Kailan ka pupunta?'),
+        ('Kanus-a ka moadto sa balay?', 'When will you go to the house?', 'Kailan ka pupunta sa bahay?'),
+        ('Kanus-a ka moadto sa balay sa akong higala?', 'When will you go to my friend\'s house?', 'Kailan ka pupunta sa bahay ng aking kaibigan?'),
+    ),
+    'ngano': (
+        ('Ngano ka moadto?', 'Why are you going?', 'Bakit ka pupunta?'),
+        ('Ngano ka moadto sa balay?', 'Why are you going to the house?', 'Bakit ka pupunta sa bahay?'),
+        ('Ngano ka moadto sa balay sa akong higala karon?', 'Why are you going to my friend\'s house now?', 'Bakit ka pupunta sa bahay ng aking kaibigan ngayon?'),
+    ),
+}
+
+# A template row with its bound str.format_map methods, resolved once at import
+CompiledTemplate = Tuple[Callable[[Dict[str, str]], str], Callable[[Dict[str, str]], str], Callable[[Dict[str, str]], str]]
+
+def compile_templates(templates: Tuple[Tuple[str, str, str], ...]) -> Tuple[CompiledTemplate, ...]:
+    """Bind format_map on every (bisaya, english, tagalog) template string."""
+    return tuple(
+        (bisaya_t.format_map, english_t.format_map, tagalog_t.format_map)
+        for bisaya_t, english_t, tagalog_t in templates
+    )
+
+# Fallback examples for words without a dedicated template, filled with str.format_map
+GENERIC_PHRASE_TEMPLATES = compile_templates((
+    ('{bisaya}.', '{english}.', '{tagalog}.'),
+    ('{bisaya}, mahimo ba?', '{english}, is it possible?', '{tagalog}, posible ba?'),
+    ('{bisaya}, mahimo ba nimo ko tabangan?', '{english}, can you help me?', '{tagalog}, maaari mo ba akong tulungan?'),
+))
+GENERIC_VERB_TEMPLATES = compile_templates((
+    ('Gusto ko mo{base_verb}.', 'I want to {english}.', 'Gusto kong {tagalog}.'),
+    ('Mo{base_verb} ko karon.', 'I will {english} now.', '{tagalog_cap} ako ngayon.'),
+    ('Gi{base_verb} nako ang tanan ganina.', 'I {past_tense} everything earlier.', '{tagalog_cap} ko ang lahat kanina.'),
+))
+GENERIC_NOUN_TEMPLATES = compile_templates((
+    ('Gusto ko ug {bisaya}.', 'I want {english}.', 'Gusto ko ng {tagalog}.'),
+    ('Naa koy {bisaya} sa balay.', 'I have {english} at home.', 'May {tagalog} ako sa bahay.'),
+    ('Ang {bisaya} nga gipalit nako kay nindot kaayo.', 'The {english} I bought is very beautiful.', 'Ang {tagalog} na binili ko ay napakaganda.'),
+))
+GENERIC_ADJECTIVE_TEMPLATES = compile_templates((
+    ('{bisaya} kaayo.', 'Very {english}.', 'Napaka{tagalog}.'),
+    ('Ang balay kay {bisaya} kaayo.', 'The house is very {english}.', 'Napaka{tagalog} ng bahay.'),
+    ('Ang balay nga gipalit nako kay {bisaya} kaayo.', 'The house I bought is very {english}.', 'Ang bahay na binili ko ay napaka{tagalog}.'),
+))
+GENERIC_NUMBER_TEMPLATES = compile_templates((
+    ('Naa koy {bisaya} ka libro.', 'I have {english} books.', 'May {tagalog} libro ako.'),
+    ('Gusto ko ug {bisaya} ka libro.', 'I want {english} books.', 'Gusto ko ng {tagalog} libro.'),
+    ('Gipalit nako ang {bisaya} ka libro sa tindahan.', 'I bought {english} books at the store.', 'Binili ko ang {tagalog} libro sa tindahan.'),
+))
+GENERIC_TIME_TEMPLATES = compile_templates((
+    ('{bisaya} ko moadto.', 'I will go {english}.', 'Pupunta ako {tagalog}.'),
+    ('{bisaya}, moadto ko sa balay.', '{english_cap}, I will go to the house.', '{tagalog_cap}, pupunta ako sa bahay.'),
+    ('{bisaya}, moadto ko sa balay sa akong higala.', '{english_cap}, I will go to my friend\'s house.', '{tagalog_cap}, pupunta ako sa bahay ng aking kaibigan.'),
+))
+GENERIC_QUESTION_TEMPLATES = compile_templates((
+    ('{bisaya}?', '{english}?', '{tagalog}?'),
+    ('{bisaya} ka moadto?', '{english} are you going?', '{tagalog} ka pupunta?'),
+    ('{bisaya} ka moadto sa balay?', '{english} are you going to the house?', '{tagalog} ka pupunta sa bahay?'),
+))
+# 'Maayong <time of day>' greetings, built around the last word of the greeting
+MAAYONG_TEMPLATES = compile_templates((
+    ('{bisaya}.', '{english}.', '{tagalog}.'),
+    ('Maayong {bisaya_last} sa tanan!', 'Good {english_last} to everyone!', '{tagalog} sa lahat!'),
+    ('Maayong {bisaya_last}! Kumusta ang imong adlaw?', 'Good {english_last}! How is your day?', '{tagalog}! Kumusta ang iyong araw?'),
+))
+GENERIC_WORD_TEMPLATES = compile_templates((
+    ('{bisaya} na.', '{english} now.', '{tagalog} ngayon.'),
+    ('Gusto ko ug {bisaya}.', 'I want {english_lower}.', 'Gusto ko ng {tagalog_lower}.'),
+    ('Gipalit nako ang {bisaya} sa tindahan.', 'I bought the {english_lower} at the store.', 'Binili ko ang {tagalog_lower} sa tindahan.'),
+))
+
+def fill_templates(templates: Tuple[CompiledTemplate, ...], fields: Dict[str, str], has_tagalog: bool) -> Tuple[Tuple[str, str, str], ...]:
+    """Format each compiled template; Tagalog stays empty without a translation."""
+    if has_tagalog:
+        return tuple((fill_bisaya(fields), fill_english(fields), fill_tagalog(fields))
+                     for fill_bisaya, fill_english, fill_tagalog in templates)
+    return tuple((fill_bisaya(fields), fill_english(fields), '')
+                 for fill_bisaya, fill_english, _ in templates)
+
+class WordFields(NamedTuple):
+    """Normalized forms of one entry, shared by the POS example builders."""
+    bisaya: str
+    bisaya_lower: str
+    english: str
+    english_clean: str
+    english_clean_lower: str
+    tagalog: str
+    tagalog_lower: str
+    has_tagalog: bool
+    bisaya_hits: frozenset
+    english_hits: frozenset
+
+Examples = Tuple[Tuple[str, str, str], Tuple[str, str, str], Tuple[str, str, str]]
+
+def greeting_examples(w: WordFields) -> Examples:
+    key = match_template(GREETING_RULES, w.bisaya_lower, w.bisaya_hits, w.english_hits)
+    if key in GREETING_TEMPLATES:
+        return GREETING_TEMPLATES[key]
+    if key == 'maayong':
+        eng_clean = w.english.split('/', 1)[0].strip()
+        # Time of day, e.g. 'buntag' / 'morning'
+        bis_parts = w.bisaya.split()
+        eng_parts = eng_clean.split()
+        bis_last = bis_parts[-1] if len(bis_parts) > 1 else ''
+        eng_last = eng_parts[-1] if len(eng_parts) > 1 else ''
+        return fill_templates(MAAYONG_TEMPLATES, {
+            'bisaya': w.bisaya, 'english': eng_clean, 'tagalog': w.tagalog,
+            'bisaya_last': bis_last, 'english_last': eng_last,
+        }, w.has_tagalog)
+    return fill_templates(
+        GENERIC_PHRASE_TEMPLATES, {'bisaya': w.bisaya, 'english': w.english_clean, 'tagalog': w.tagalog}, w.has_tagalog)
+
+def verb_examples(w: WordFields) -> Examples:
+    key = match_template(VERB_RULES, w.bisaya_lower, w.bisaya_hits, w.english_hits)
+    if key:
+        return VERB_TEMPLATES[key]
+    # Generic verb patterns
+    base = get_base_form(w.bisaya)
+    base_verb = base if base != w.bisaya_lower else w.bisaya_lower.replace('mo', '').replace('mag', '').replace('nag', '').replace('gi', '')
+    english_verb = w.english_clean_lower
+    # Tagalog verb form is simplified to the base Tagalog word
+    return fill_templates(GENERIC_VERB_TEMPLATES, {
+        'base_verb': base_verb, 'english': english_verb, 'past_tense': get_past_tense(english_verb),
+        'tagalog': w.tagalog_lower, 'tagalog_cap': w.tagalog_lower.capitalize(),
+    }, w.has_tagalog)
+
+def noun_examples(w: WordFields) -> Examples:
+    key = match_template(NOUN_RULES, w.bisaya_lower, w.bisaya_hits, w.english_hits)
+    if key:
+        return NOUN_TEMPLATES[key]
+    return fill_templates(
+        GENERIC_NOUN_TEMPLATES, {'bisaya': w.bisaya, 'english': w.english_clean_lower, 'tagalog': w.tagalog_lower}, w.has_tagalog)
+
+def adjective_examples(w: WordFields) -> Examples:
+    key = match_template(ADJECTIVE_RULES, w.bisaya_lower, w.bisaya_hits, w.english_hits)
+    if key:
+        return ADJECTIVE_TEMPLATES[key]
+    return fill_templates(
+        GENERIC_ADJECTIVE_TEMPLATES, {'bisaya': w.bisaya, 'english': w.english_clean_lower, 'tagalog': w.tagalog_lower}, w.has_tagalog)
+
+def number_examples(w: WordFields) -> Examples:
+    key = match_template(NUMBER_RULES, w.bisaya_lower, w.bisaya_hits, w.english_hits)
+    if key:
+        return NUMBER_TEMPLATES[key]
+    return fill_templates(
+        GENERIC_NUMBER_TEMPLATES, {'bisaya': w.bisaya, 'english': w.english_clean_lower, 'tagalog': w.tagalog_lower}, w.has_tagalog)
+
+def time_examples(w: WordFields) -> Examples:
+    key = match_template(TIME_RULES, w.bisaya_lower, w.bisaya_hits, w.english_hits)
+    if key:
+        return TIME_TEMPLATES[key]
+    return fill_templates(GENERIC_TIME_TEMPLATES, {
+        'bisaya': w.bisaya, 'english': w.english_clean_lower, 'english_cap': w.english_clean_lower.capitalize(),
+        'tagalog': w.tagalog_lower, 'tagalog_cap': w.tagalog_lower.capitalize(),
+    }, w.has_tagalog)
+
+def question_examples(w: WordFields) -> Examples:
+    key = match_template(QUESTION_RULES, w.bisaya_lower, w.bisaya_hits, w.english_hits)
+    if key:
+        return QUESTION_TEMPLATES[key]
+    return fill_templates(
+        GENERIC_QUESTION_TEMPLATES, {'bisaya': w.bisaya, 'english': w.english_clean, 'tagalog': w.tagalog}, w.has_tagalog)
+
+def default_examples(w: WordFields) -> Examples:
+    # Multi-word phrases
+    if ' ' in w.bisaya:
+        return fill_templates(
+            GENERIC_PHRASE_TEMPLATES, {'bisaya': w.bisaya, 'english': w.english_clean, 'tagalog': w.tagalog}, w.has_tagalog)
+    return fill_templates(GENERIC_WORD_TEMPLATES, {
+        'bisaya': w.bisaya, 'english': w.english_clean, 'english_lower': w.english_clean_lower,
+        'tagalog': w.tagalog, 'tagalog_lower': w.tagalog_lower,
+    }, w.has_tagalog)
+
+class PosClass(NamedTuple):
+    """How a POS branch is selected: by the tagged POS or by words in the Bisaya entry."""
+    name: str
+    pos_exact: Tuple[str, ...] = ()     # the POS is exactly one of these
+    pos_contains: Tuple[str, ...] = ()  # the POS contains one of these
+    words: frozenset = frozenset()      # the Bisaya entry contains one of these words
+
+# Checked in order; the first class that applies picks the example builder.
+POS_CLASSES = (
+    PosClass('greeting', pos_exact=('greeting', 'expression', 'response')),
+    PosClass('verb', pos_contains=('verb',), words=VERB_WORDS),
+    PosClass('noun', pos_contains=('noun',)),
+    PosClass('adjective', pos_contains=('adjective', 'adj')),
+    PosClass('number', pos_contains=('number',), words=NUMBER_WORDS),
+    PosClass('time', pos_contains=('time',), words=TIME_WORDS),
+    PosClass('question', pos_contains=('question',), words=QUESTION_WORDS),
+)
+POS_HANDLERS: Dict[str, Callable[[WordFields], Examples]] = {
+    'greeting': greeting_examples,
+    'verb': verb_examples,
+    'noun': noun_examples,
+    'adjective': adjective_examples,
+    'number': number_examples,
+    'time': time_examples,
+    'question': question_examples,
+    'default': default_examples,
+}
+
+@functools.lru_cache(maxsize=None)
+def _pos_class_index(pos_lower: str) -> int:
+    """Index of the first class matched by the POS tag alone (len(POS_CLASSES) if none)."""
+    for i, pos_class in enumerate(POS_CLASSES):
+        if pos_lower in pos_class.pos_exact or any(part in pos_lower for part in pos_class.pos_contains):
+            return i
+    return len(POS_CLASSES)
+
+# Guard word -> index of the earliest POS class it belongs to (built last-to-first so earlier wins)
+GUARD_WORD_CLASS: Dict[str, int] = {
+    word: index
+    for index, pos_class in reversed(list(enumerate(POS_CLASSES)))
+    for word in pos_class.words
+}
 
-def generate_examples(bisaya: str, tagalog: str, english: str, pos: str, category: str = '') -> Tuple[Tuple[str, str, str], Tuple[str, str, str], Tuple[str, str, str]]:
+def classify_pos(pos_lower: str, bisaya_words: List[str]) -> str:
+    """Name of the POS builder for an entry: its tagged class, unless a guard word picks an earlier one."""
+    index = _pos_class_index(pos_lower)
+    for word in bisaya_words:
+        index = min(index, GUARD_WORD_CLASS.get(word, index))
+    return POS_CLASSES[index].name if index < len(POS_CLASSES) else 'default'
+
+def generate_examples(bisaya: str, tagalog: str, english: str, pos: str, category: str = '') -> Examples:
     """
     Generate beginner, intermediate, and advanced sentence examples with Tagalog translations.
     Returns tuple: ((beginner_bisaya, beginner_english, beginner_tagalog), 
                     (intermediate_bisaya, intermediate_english, intermediate_tagalog),
                     (advanced_bisaya, advanced_english, advanced_tagalog))
     """
+    # Missing Tagalog is treated the same as an empty string
+    return _generate_examples_cached(bisaya, tagalog or '', english, pos)
+
+@functools.lru_cache(maxsize=None)
+def _generate_examples_cached(bisaya: str, tagalog: str, english: str, pos: str) -> Examples:
+    """Build the examples for generate_examples; cached since rows repeat words."""
     bisaya_lower = bisaya.lower()
+    # English meaning without alternatives ('a / b') or notes ('(...)')
+    english_clean = english.split('/', 1)[0].split('(', 1)[0].strip()
+    fields = WordFields(
+        bisaya=bisaya,
+        bisaya_lower=bisaya_lower,
+        english=english,
+        english_clean=english_clean,
+        english_clean_lower=english_clean.lower(),
+        tagalog=tagalog,
+        tagalog_lower=tagalog.lower(),
+        has_tagalog=bool(tagalog),
+        bisaya_hits=scan_triggers(bisaya_lower, BISAYA_SCANNER),
+        english_hits=scan_triggers(english.lower(), ENGLISH_SCANNER),
+    )
+    kind = classify_pos(pos.lower(), bisaya_lower.split())
+    return POS_HANDLERS[kind](fields)
+
+# POS tags checked in order by substring; the first hit decides how the category is picked
+CATEGORY_POS_BRANCHES = (
+    ('greeting', 'greeting'),
+    ('expression', 'phrase'),
+    ('response', 'phrase'),
+    ('number', 'number'),
+    ('verb', 'verb'),
+    ('noun', 'noun'),
+    ('adjective', 'adjective'),
+    ('time', 'time'),
+    ('question', 'question'),
+)
+# Branches whose category does not depend on the English meaning
+FIXED_CATEGORIES = {
+    'greeting': 'Greetings',
+    'phrase': 'Common Phrases',
+    'number': 'Numbers',
+    'adjective': 'Descriptions',
+    'time': 'Time',
+}
+# (category, English keyword pattern) checked in order within the verb and noun branches.
+# Keywords match anywhere in the meaning, so 'eating' counts as 'eat'.
+VERB_CATEGORIES = (
+    ('Food & Dining', re.compile(r'eat|drink|cook|food')),
+    ('Market/Shopping', re.compile(r'buy|sell|market|shop')),
+)
+NOUN_CATEGORIES = (
+    ('Family', re.compile(r'father|mother|family|brother|sister')),
+    ('Food & Dining', re.compile(r'food|water|rice|bread|fruit')),
+    ('Home & Living', re.compile(r'house|room|door|window')),
+    ('Education', re.compile(r'book|school|student|teacher')),
+)
+TIME_PATTERN = re.compile(r'now|today|tomorrow|yesterday|day|month|year')
+
+@functools.lru_cache(maxsize=None)
+def _category_branch(pos_lower: str) -> str:
+    """First category branch the POS tag selects; cached since there are few distinct tags."""
+    for part, branch in CATEGORY_POS_BRANCHES:
+        if part in pos_lower:
+            return branch
+    return ''
+
+def _keyword_category(categories: Tuple[Tuple[str, re.Pattern], ...], english_lower: str, default: str) -> str:
+    for category, pattern in categories:
+        if pattern.search(english_lower):
+            return category
+    return default
+
+def determine_category(pos: str, english: str) -> str:
+    """Determine category based on part of speech and meaning."""
+    branch = _category_branch(pos.lower())
+    if branch in FIXED_CATEGORIES:
+        return FIXED_CATEGORIES[branch]
     english_lower = english.lower()
-    pos_lower = pos.lower()
-    tagalog_lower = tagalog.lower() if tagalog else ''
-    
-    # Handle multi-word phrases
-    is_phrase = ' ' in bisaya
-    
-    # Helper function to create example with translations - returns tuple
-    def make_example(bisaya_sent: str, english_sent: str, tagalog_sent: str) -> Tuple[str, str, str]:
-        """Create example with separate translations.
-        Returns: (bisaya_sentence, english_translation, tagalog_translation)
-        """
-        return (bisaya_sent, english_sent, tagalog_sent if tagalog_sent else '')
-    
-    # Greetings and Expressions
-    if pos_lower in ['greeting', 'expression', 'response']:
-        if 'kumusta' in bisaya_lower:
-            beginner = make_example('Kumusta ka?', 'How are you?', 'Kumusta ka?')
-            intermediate = make_example('Kumusta na ka karon?', 'How are you now?', 'Kumusta ka na ngayon?')
-            advanced = make_example('Kumusta na ka? Maayo ra ba?', 'How are you? Are you doing well?', 'Kumusta ka na? Mabuti ba?')
-        elif 'maayong' in bisaya_lower:
-            eng_clean = english.split('/')[0].strip()
-            tag_clean = tagalog if tagalog else ''
-            beginner = make_example(f'{bisaya}.', f'{eng_clean}.', f'{tag_clean}.' if tag_clean else '')
-            intermediate = make_example(
-                f'Maayong {bisaya.split()[-1] if len(bisaya.split()) > 1 else ""} sa tanan!',
-                f'Good {eng_clean.split()[-1] if len(eng_clean.split()) > 1 else ""} to everyone!',
-                f'{tag_clean} sa lahat!' if tag_clean else ''
-            )
-            advanced = make_example(
-                f'Maayong {bisaya.split()[-1] if len(bisaya.split()) > 1 else ""}! Kumusta ang imong adlaw?',
-                f'Good {eng_clean.split()[-1] if len(eng_clean.split()) > 1 else ""}! How is your day?',
-                f'{tag_clean}! Kumusta ang iyong araw?' if tag_clean else ''
-            )
-        elif 'salamat' in bisaya_lower:
-            beginner = make_example('Salamat.', 'Thank you.', 'Salamat.')
-            intermediate = make_example('Daghang salamat sa imong tabang.', 'Thank you very much for your help.', 'Maraming salamat sa iyong tulong.')
-            advanced = make_example('Daghang salamat kaayo sa tanan nga imong nahimo.', 'Thank you very much for everything you did.', 'Maraming salamat sa lahat ng iyong ginawa.')
-        elif 'palihug' in bisaya_lower:
-            beginner = make_example('Palihug.', 'Please.', 'Pakiusap.')
-            intermediate = make_example('Palihug, tabangi ko.', 'Please, help me.', 'Pakiusap, tulungan mo ako.')
-            advanced = make_example('Palihug, mahimo ba nimo ko tabangan karon?', 'Please, can you help me now?', 'Pakiusap, maaari mo ba akong tulungan ngayon?')
-        elif 'pasaylo' in bisaya_lower:
-            beginner = make_example('Pasaylo.', 'Sorry.', 'Paumanhin.')
-            intermediate = make_example('Pasaylo sa akong nahimo.', 'Sorry for what I did.', 'Paumanhin sa aking ginawa.')
-            advanced = make_example('Pasaylo kaayo sa tanan nga kasaypanan.', 'I am very sorry for all the mistakes.', 'Paumanhin sa lahat ng pagkakamali.')
-        elif bisaya_lower in ['oo', 'yes']:
-            beginner = make_example('Oo.', 'Yes.', 'Oo.')
-            intermediate = make_example('Oo, gusto ko.', 'Yes, I want to.', 'Oo, gusto ko.')
-            advanced = make_example('Oo, sigurado ko nga gusto ko.', 'Yes, I am sure I want to.', 'Oo, sigurado ako na gusto ko.')
-        elif bisaya_lower in ['dili', 'no']:
-            beginner = make_example('Dili.', 'No.', 'Hindi.')
-            intermediate = make_example('Dili ko gusto.', 'I don\'t want to.', 'Ayaw ko.')
-            advanced = make_example('Dili ko gusto nga moadto didto.', 'I don\'t want to go there.', 'Ayaw kong pumunta doon.')
-        else:
-            eng_clean = english.split('/')[0].split('(')[0].strip()
-            tag_clean = tagalog if tagalog else ''
-            beginner = make_example(f'{bisaya}.', f'{eng_clean}.', f'{tag_clean}.' if tag_clean else '')
-            intermediate = make_example(f'{bisaya}, mahimo ba?', f'{eng_clean}, is it possible?', f'{tag_clean}, posible ba?' if tag_clean else '')
-            advanced = make_example(f'{bisaya}, mahimo ba nimo ko tabangan?', f'{eng_clean}, can you help me?', f'{tag_clean}, maaari mo ba akong tulungan?' if tag_clean else '')
-    
-    # Verbs
-    elif 'verb' in pos_lower or any(v in bisaya_lower for v in ['mokaon', 'matulog', 'mobasa', 'mosulat', 'mopalit']):
-        base = get_base_form(bisaya)
-        if 'kaon' in bisaya_lower or 'eat' in english_lower:
-            beginner = make_example('Gusto ko mokaon.', 'I want to eat.', 'Gusto kong kumain.')
-            intermediate = make_example('Nakaon na ba ka?', 'Have you eaten already?', 'Kumain ka na ba?')
-            advanced = make_example('Gikaon nako ang tinapay ganina.', 'I ate the bread earlier.', 'Kumain ako ng tinapay kanina.')
-        elif 'tulog' in bisaya_lower or 'sleep' in english_lower:
-            beginner = make_example('Gusto ko matulog.', 'I want to sleep.', 'Gusto kong matulog.')
-            intermediate = make_example('Natulog na ba ka?', 'Have you slept already?', 'Natulog ka na ba?')
-            advanced = make_example('Kinahanglan nga matulog ka aron makapahuway.', 'You need to sleep to rest.', 'Kailangan mong matulog para makapahinga.')
-        elif 'basa' in bisaya_lower or 'read' in english_lower:
-            beginner = make_example('Gusto ko mobasa.', 'I want to read.', 'Gusto kong magbasa.')
-            intermediate = make_example('Nagbasa ko ug libro.', 'I am reading a book.', 'Nagbabasa ako ng libro.')
-            advanced = make_example('Gibasa nako ang libro ganina.', 'I read the book earlier.', 'Binasa ko ang libro kanina.')
-        elif 'sulat' in bisaya_lower or 'write' in english_lower:
-            beginner = make_example('Gusto ko mosulat.', 'I want to write.', 'Gusto kong sumulat.')
-            intermediate = make_example('Nagsulat ko ug sulat.', 'I am writing a letter.', 'Nagsusulat ako ng sulat.')
-            advanced = make_example('Gisulat nako ang sulat kagahapon.', 'I wrote the letter yesterday.', 'Sinulat ko ang sulat kahapon.')
-        elif 'palit' in bisaya_lower or 'buy' in english_lower:
-            beginner = make_example('Gusto ko mopalit.', 'I want to buy.', 'Gusto kong bumili.')
-            intermediate = make_example('Mopalit ko ug tinapay.', 'I will buy bread.', 'Bibili ako ng tinapay.')
-            advanced = make_example('Gipalit nako ang tinapay sa tindahan.', 'I bought the bread at the store.', 'Binili ko ang tinapay sa tindahan.')
-        elif 'lakaw' in bisaya_lower or 'walk' in english_lower:
-            beginner = make_example('Gusto ko molakaw.', 'I want to walk.', 'Gusto kong maglakad.')
-            intermediate = make_example('Naglakaw ko sa dalan.', 'I am walking on the road.', 'Naglalakad ako sa kalsada.')
-            advanced = make_example('Naglakaw ko gikan sa balay padulong sa eskwelahan.', 'I walked from home to school.', 'Naglalakad ako mula sa bahay papunta sa paaralan.')
-        elif 'dagan' in bisaya_lower or 'run' in english_lower:
-            beginner = make_example('Gusto ko modagan.', 'I want to run.', 'Gusto kong tumakbo.')
-            intermediate = make_example('Nagdagan ko sa parke.', 'I am running in the park.', 'Tumatakbo ako sa parke.')
-            advanced = make_example('Nagdagan ko aron makab-ot ang bus.', 'I ran to catch the bus.', 'Tumakbo ako para mahabol ang bus.')
-        elif 'adto' in bisaya_lower or 'go' in english_lower:
-            beginner = make_example('Moadto ko.', 'I will go.', 'Pupunta ako.')
-            intermediate = make_example('Moadto ko sa balay.', 'I will go to the house.', 'Pupunta ako sa bahay.')
-            advanced = make_example('Moadto ko sa balay sa akong higala.', 'I will go to my friend\'s house.', 'Pupunta ako sa bahay ng aking kaibigan.')
-        else:
-            # Generic verb patterns
-            base_verb = base if base != bisaya_lower else bisaya_lower.replace('mo', '').replace('mag', '').replace('nag', '').replace('gi', '')
-            english_verb = english.split('/')[0].split('(')[0].strip().lower()
-            # Get past tense - simple approach (not perfect but better than adding -ed to everything)
-            past_tense = english_verb
-            if english_verb.endswith('e'):
-                past_tense = english_verb + 'd'
-            elif english_verb.endswith('y'):
-                past_tense = english_verb[:-1] + 'ied'
-            elif len(english_verb) > 1 and english_verb[-1] not in 'aeiou' and english_verb[-2] in 'aeiou':
-                past_tense = english_verb + english_verb[-1] + 'ed'
-            else:
-                past_tense = english_verb + 'ed'
-            
-            # Try to get Tagalog verb form (simplified - use base tagalog word if available)
-            tag_verb = tagalog.lower() if tagalog else ''
-            beginner = make_example(f'Gusto ko mo{base_verb}.', f'I want to {english_verb}.', f'Gusto kong {tag_verb}.' if tag_verb else '')
-            intermediate = make_example(f'Mo{base_verb} ko karon.', f'I will {english_verb} now.', f'{tag_verb.capitalize()} ako ngayon.' if tag_verb else '')
-            advanced = make_example(f'Gi{base_verb} nako ang tanan ganina.', f'I {past_tense} everything earlier.', f'{tag_verb.capitalize()} ko ang lahat kanina.' if tag_verb else '')
-    
-    # Nouns
-    elif 'noun' in pos_lower:
-        if 'tubig' in bisaya_lower or 'water' in english_lower:
-            beginner = make_example('Gusto ko ug tubig.', 'I want water.', 'Gusto ko ng tubig.')
-            intermediate = make_example('Naa koy tubig sa balay.', 'I have water at home.', 'May tubig ako sa bahay.')
-            advanced = make_example('Gipalit nako ang tubig sa tindahan.', 'I bought the water at the store.', 'Binili ko ang tubig sa tindahan.')
-        elif 'pagkaon' in bisaya_lower or 'food' in english_lower:
-            beginner = make_example('Gusto ko ug pagkaon.', 'I want food.', 'Gusto ko ng pagkain.')
-            intermediate = make_example('Naa koy pagkaon sa lamesa.', 'I have food on the table.', 'May pagkain ako sa mesa.')
-            advanced = make_example('Gipangandam nako ang pagkaon para sa tanan.', 'I prepared the food for everyone.', 'Inihanda ko ang pagkain para sa lahat.')
-        elif 'balay' in bisaya_lower or 'house' in english_lower:
-            beginner = make_example('Naa koy balay.', 'I have a house.', 'May bahay ako.')
-            intermediate = make_example('Ang balay kay dako.', 'The house is big.', 'Malaki ang bahay.')
-            advanced = make_example('Ang balay nga gipalit nako kay nindot kaayo.', 'The house I bought is very beautiful.', 'Ang bahay na binili ko ay napakaganda.')
-        elif 'libro' in bisaya_lower or 'book' in english_lower:
-            beginner = make_example('Naa koy libro.', 'I have a book.', 'May libro ako.')
-            intermediate = make_example('Nagbasa ko ug libro.', 'I am reading a book.', 'Nagbabasa ako ng libro.')
-            advanced = make_example('Ang libro nga gibasa nako kay nindot kaayo.', 'The book I read is very beautiful.', 'Ang libro na binasa ko ay napakaganda.')
-        elif 'amahan' in bisaya_lower or 'father' in english_lower:
-            beginner = make_example('Siya ang akong amahan.', 'He is my father.', 'Siya ang aking ama.')
-            intermediate = make_example('Ang akong amahan kay maayo kaayo.', 'My father is very good.', 'Ang aking ama ay napakabuti.')
-            advanced = make_example('Ang akong amahan nga nagtrabaho sa opisina kay kusgan kaayo.', 'My father who works at the office is very strong.', 'Ang aking ama na nagtatrabaho sa opisina ay napakalakas.')
-        elif 'inahan' in bisaya_lower or 'mother' in english_lower:
-            beginner = make_example('Siya ang akong inahan.', 'She is my mother.', 'Siya ang aking ina.')
-            intermediate = make_example('Ang akong inahan kay gwapa kaayo.', 'My mother is very beautiful.', 'Ang aking ina ay napakaganda.')
-            advanced = make_example('Ang akong inahan nga nagluto sa kusina kay maayo kaayo.', 'My mother who cooks in the kitchen is very good.', 'Ang aking ina na nagluluto sa kusina ay napakabuti.')
-        else:
-            # Generic noun patterns - handle special cases
-            english_lower_check = english.lower()
-            english_clean = english.split('/')[0].split('(')[0].strip().lower()
-            if 'adlaw' in bisaya_lower or ('day' in english_lower_check and 'sun' in english_lower_check):
-                beginner = make_example('Maayong adlaw.', 'Good day.', 'Magandang araw.')
-                intermediate = make_example('Init kaayo ang adlaw karon.', 'The sun is very hot today.', 'Napakainit ng araw ngayon.')
-                advanced = make_example('Ang adlaw nga nag-init sa balay kay init kaayo.', 'The sun that heats the house is very hot.', 'Ang araw na nagpapainit sa bahay ay napakainit.')
-            elif 'bulan' in bisaya_lower or ('month' in english_lower_check and 'moon' in english_lower_check):
-                beginner = make_example('Maayong bulan.', 'Good month.', 'Magandang buwan.')
-                intermediate = make_example('Nindot kaayo ang bulan karon.', 'The moon is very beautiful tonight.', 'Napakaganda ng buwan ngayon.')
-                advanced = make_example('Ang bulan nga nagdan-ag sa dalan kay nindot kaayo.', 'The moon that lights the road is very beautiful.', 'Ang buwan na nagliliwanag sa kalsada ay napakaganda.')
-            else:
-                tag_clean = tagalog.lower() if tagalog else ''
-                beginner = make_example(f'Gusto ko ug {bisaya}.', f'I want {english_clean}.', f'Gusto ko ng {tag_clean}.' if tag_clean else '')
-                intermediate = make_example(f'Naa koy {bisaya} sa balay.', f'I have {english_clean} at home.', f'May {tag_clean} ako sa bahay.' if tag_clean else '')
-                advanced = make_example(f'Ang {bisaya} nga gipalit nako kay nindot kaayo.', f'The {english_clean} I bought is very beautiful.', f'Ang {tag_clean} na binili ko ay napakaganda.' if tag_clean else '')
-    
-    # Adjectives
-    elif 'adjective' in pos_lower or 'adj' in pos_lower:
-        if 'wala' in bisaya_lower or 'none' in english_lower or 'nothing' in english_lower:
-            beginner = make_example('Wala ko.', 'I have nothing.', 'Wala ako.')
-            intermediate = make_example('Wala koy kwarta.', 'I have no money.', 'Wala akong pera.')
-            advanced = make_example('Wala koy kwarta nga magasto karon.', 'I have no money to spend now.', 'Wala akong pera na magagastos ngayon.')
-        elif 'daghan' in bisaya_lower or 'many' in english_lower or 'much' in english_lower:
-            beginner = make_example('Daghan kaayo.', 'A lot.', 'Marami.')
-            intermediate = make_example('Daghan kaayo ang tawo.', 'There are many people.', 'Maraming tao.')
-            advanced = make_example('Daghan kaayo ang tawo nga nakaon sa restaurant.', 'There are many people eating at the restaurant.', 'Maraming tao na kumakain sa restaurant.')
-        elif 'maayo' in bisaya_lower or 'good' in english_lower:
-            beginner = make_example('Maayo kaayo.', 'Very good.', 'Napakabuti.')
-            intermediate = make_example('Ang pagkaon kay maayo kaayo.', 'The food is very good.', 'Napakasarap ng pagkain.')
-            advanced = make_example('Ang pagkaon nga gipangandam nako kay maayo kaayo sa tanan.', 'The food I prepared is very good for everyone.', 'Ang pagkain na inihanda ko ay napakasarap para sa lahat.')
-        elif 'gwapa' in bisaya_lower or ('beautiful' in english_lower and 'female' in english_lower):
-            beginner = make_example('Gwapa kaayo.', 'Very beautiful.', 'Napakaganda.')
-            intermediate = make_example('Ang babaye kay gwapa kaayo.', 'The woman is very beautiful.', 'Napakaganda ng babae.')
-            advanced = make_example('Ang babaye nga naglakaw sa dalan kay gwapa kaayo.', 'The woman walking on the road is very beautiful.', 'Ang babae na naglalakad sa kalsada ay napakaganda.')
-        elif 'gwapo' in bisaya_lower or 'handsome' in english_lower:
-            beginner = make_example('Gwapo kaayo.', 'Very handsome.', 'Napakagwapo.')
-            intermediate = make_example('Ang lalaki kay gwapo kaayo.', 'The man is very handsome.', 'Napakagwapo ng lalaki.')
-            advanced = make_example('Ang lalaki nga naglakaw sa dalan kay gwapo kaayo.', 'The man walking on the road is very handsome.', 'Ang lalaki na naglalakad sa kalsada ay napakagwapo.')
-        elif 'dako' in bisaya_lower or 'big' in english_lower:
-            beginner = make_example('Dako kaayo.', 'Very big.', 'Napakalaki.')
-            intermediate = make_example('Ang balay kay dako kaayo.', 'The house is very big.', 'Napakalaki ng bahay.')
-            advanced = make_example('Ang balay nga gipalit nako kay dako kaayo ug nindot.', 'The house I bought is very big and beautiful.', 'Ang bahay na binili ko ay napakalaki at napakaganda.')
-        elif 'gamay' in bisaya_lower or 'small' in english_lower:
-            beginner = make_example('Gamay kaayo.', 'Very small.', 'Napakaliit.')
-            intermediate = make_example('Ang bata kay gamay kaayo.', 'The child is very small.', 'Napakaliit ng bata.')
-            advanced = make_example('Ang bata nga nagdula sa parke kay gamay kaayo.', 'The child playing in the park is very small.', 'Ang bata na naglalaro sa parke ay napakaliit.')
-        elif 'init' in bisaya_lower or 'hot' in english_lower:
-            beginner = make_example('Init kaayo.', 'Very hot.', 'Napakainit.')
-            intermediate = make_example('Ang tubig kay init kaayo.', 'The water is very hot.', 'Napakainit ng tubig.')
-            advanced = make_example('Ang tubig nga gipainit nako kay init kaayo karon.', 'The water I heated is very hot now.', 'Ang tubig na pinainit ko ay napakainit ngayon.')
-        elif 'bugnaw' in bisaya_lower or 'cold' in english_lower:
-            beginner = make_example('Bugnaw kaayo.', 'Very cold.', 'Napakalamig.')
-            intermediate = make_example('Ang tubig kay bugnaw kaayo.', 'The water is very cold.', 'Napakalamig ng tubig.')
-            advanced = make_example('Ang tubig nga gikan sa gripo kay bugnaw kaayo.', 'The water from the faucet is very cold.', 'Ang tubig na galing sa gripo ay napakalamig.')
-        elif 'tibuok' in bisaya_lower or 'whole' in english_lower or 'complete' in english_lower:
-            beginner = make_example('Tibuok ang libro.', 'The whole book.', 'Buong libro.')
-            intermediate = make_example('Gibasa nako ang tibuok nga libro.', 'I read the whole book.', 'Binasa ko ang buong libro.')
-            advanced = make_example('Gibasa nako ang tibuok nga libro sulod sa usa ka adlaw.', 'I read the whole book within one day.', 'Binasa ko ang buong libro sa loob ng isang araw.')
-        elif 'bahin' in bisaya_lower or 'part' in english_lower:
-            beginner = make_example('Bahin lang.', 'Just a part.', 'Bahagi lang.')
-            intermediate = make_example('Gibasa nako ang bahin sa libro.', 'I read part of the book.', 'Binasa ko ang bahagi ng libro.')
-            advanced = make_example('Gibasa nako ang bahin sa libro nga importante.', 'I read the important part of the book.', 'Binasa ko ang mahalagang bahagi ng libro.')
-        elif 'bag-o' in bisaya_lower or 'new' in english_lower:
-            beginner = make_example('Bag-o kaayo.', 'Very new.', 'Napakabago.')
-            intermediate = make_example('Ang libro kay bag-o kaayo.', 'The book is very new.', 'Napakabago ng libro.')
-            advanced = make_example('Ang libro nga gipalit nako kay bag-o kaayo ug nindot.', 'The book I bought is very new and beautiful.', 'Ang libro na binili ko ay napakabago at napakaganda.')
-        elif 'karaan' in bisaya_lower or 'old' in english_lower:
-            beginner = make_example('Karaan kaayo.', 'Very old.', 'Napakaluma.')
-            intermediate = make_example('Ang libro kay karaan kaayo.', 'The book is very old.', 'Napakaluma ng libro.')
-            advanced = make_example('Ang libro nga gikan sa library kay karaan kaayo.', 'The book from the library is very old.', 'Ang libro na galing sa library ay napakaluma.')
-        elif 'taas' in bisaya_lower or 'tall' in english_lower or 'high' in english_lower:
-            beginner = make_example('Taas kaayo.', 'Very tall.', 'Napakataas.')
-            intermediate = make_example('Ang tawo kay taas kaayo.', 'The person is very tall.', 'Napakataas ng tao.')
-            advanced = make_example('Ang tawo nga naglakaw sa dalan kay taas kaayo.', 'The person walking on the road is very tall.', 'Ang tao na naglalakad sa kalsada ay napakataas.')
-        elif 'mubo' in bisaya_lower or 'short' in english_lower or 'low' in english_lower:
-            beginner = make_example('Mubo kaayo.', 'Very short.', 'Napakababa.')
-            intermediate = make_example('Ang tawo kay mubo kaayo.', 'The person is very short.', 'Napakababa ng tao.')
-            advanced = make_example('Ang tawo nga naglakaw sa dalan kay mubo kaayo.', 'The person walking on the road is very short.', 'Ang tao na naglalakad sa kalsada ay napakababa.')
-        elif 'lapad' in bisaya_lower or 'wide' in english_lower:
-            beginner = make_example('Lapad kaayo.', 'Very wide.', 'Napakalapad.')
-            intermediate = make_example('Ang dalan kay lapad kaayo.', 'The road is very wide.', 'Napakalapad ng kalsada.')
-            advanced = make_example('Ang dalan nga gipangita nako kay lapad kaayo.', 'The road I am looking for is very wide.', 'Ang kalsada na hinahanap ko ay napakalapad.')
-        else:
-            # Generic adjective patterns - use appropriate context
-            english_clean = english.split('/')[0].split('(')[0].strip().lower()
-            tag_clean = tagalog.lower() if tagalog else ''
-            beginner = make_example(f'{bisaya} kaayo.', f'Very {english_clean}.', f'Napaka{tag_clean}.' if tag_clean else '')
-            intermediate = make_example(f'Ang balay kay {bisaya} kaayo.', f'The house is very {english_clean}.', f'Napaka{tag_clean} ng bahay.' if tag_clean else '')
-            advanced = make_example(f'Ang balay nga gipalit nako kay {bisaya} kaayo.', f'The house I bought is very {english_clean}.', f'Ang bahay na binili ko ay napaka{tag_clean}.' if tag_clean else '')
+    if branch == 'verb':
+        return _keyword_category(VERB_CATEGORIES, english_lower, 'Actions')
+    if branch == 'noun':
+        return _keyword_category(NOUN_CATEGORIES, english_lower, 'Common Nouns')
+    # An untagged time word is recognised by its meaning before the question check
+    if TIME_PATTERN.search(english_lower):
+        return 'Time'
+    return 'Questions' if branch == 'question' else 'Uncategorized'
+
+CSV_HEADER = [
+    'Bisaya',
+    'Tagalog',
+    'English',
+    'Part of Speech',
+    'Pronunciation',
+    'Category',
+    'Beginner Example (Bisaya)',
+    'Beginner English Translation',
+    'Beginner Tagalog Translation',
+    'Intermediate Example (Bisaya)',
+    'Intermediate English Translation',
+    'Intermediate Tagalog Translation',
+    'Advanced Example (Bisaya)',
+    'Advanced English Translation',
+    'Advanced Tagalog Translation'
+]
+
+def build_row(word_data: Dict) -> Optional[List[str]]:
+    """Build the CSV row for one metadata entry, or None if it has no Bisaya/English."""
+    bisaya = word_data.get('bisaya', '')
+    tagalog = word_data.get('tagalog', '')
+    english = word_data.get('english', '')
+    pronunciation = word_data.get('pronunciation', '')
+    pos = word_data.get('pos', 'Unknown')
     
-    # Numbers
-    elif 'number' in pos_lower or any(n in bisaya_lower for n in ['usa', 'duha', 'tulo', 'upat', 'lima']):
-        if bisaya_lower == 'usa' or 'one' in english_lower:
-            beginner = make_example('Naa koy usa ka libro.', 'I have one book.', 'May isang libro ako.')
-            intermediate = make_example('Gusto ko ug usa ka libro.', 'I want one book.', 'Gusto ko ng isang libro.')
-            advanced = make_example('Gipalit nako ang usa ka libro sa tindahan.', 'I bought one book at the store.', 'Binili ko ang isang libro sa tindahan.')
-        elif bisaya_lower == 'duha' or 'two' in english_lower:
-            beginner = make_example('Naa koy duha ka libro.', 'I have two books.', 'May dalawang libro ako.')
-            intermediate = make_example('Gusto ko ug duha ka libro.', 'I want two books.', 'Gusto ko ng dalawang libro.')
-            advanced = make_example('Gipalit nako ang duha ka libro sa tindahan.', 'I bought two books at the store.', 'Binili ko ang dalawang libro sa tindahan.')
-        else:
-            english_clean = english.split('/')[0].split('(')[0].strip().lower()
-            tag_clean = tagalog.lower() if tagalog else ''
-            beginner = make_example(f'Naa koy {bisaya} ka libro.', f'I have {english_clean} books.', f'May {tag_clean} libro ako.' if tag_clean else '')
-            intermediate = make_example(f'Gusto ko ug {bisaya} ka libro.', f'I want {english_clean} books.', f'Gusto ko ng {tag_clean} libro.' if tag_clean else '')
-            advanced = make_example(f'Gipalit nako ang {bisaya} ka libro sa tindahan.', f'I bought {english_clean} books at the store.', f'Binili ko ang {tag_clean} libro sa tindahan.' if tag_clean else '')
+    if not bisaya or not english:
+        return None
     
-    # Time expressions
-    elif 'time' in pos_lower or any(t in bisaya_lower for t in ['karon', 'ugma', 'gahapon', 'adlaw']):
-        if 'karon' in bisaya_lower or 'now' in english_lower:
-            beginner = make_example('Karon ko moadto.', 'I will go now.', 'Pupunta ako ngayon.')
-            intermediate = make_example('Karon nga adlaw, moadto ko.', 'Today, I will go.', 'Ngayon, pupunta ako.')
-            advanced = make_example('Karon nga adlaw, moadto ko sa balay sa akong higala.', 'Today, I will go to my friend\'s house.', 'Ngayon, pupunta ako sa bahay ng aking kaibigan.')
-        elif 'ugma' in bisaya_lower or 'tomorrow' in english_lower:
-            beginner = make_example('Ugma ko moadto.', 'I will go tomorrow.', 'Pupunta ako bukas.')
-            intermediate = make_example('Ugma, moadto ko sa balay.', 'Tomorrow, I will go to the house.', 'Bukas, pupunta ako sa bahay.')
-            advanced = make_example('Ugma, moadto ko sa balay sa akong higala aron magdula.', 'Tomorrow, I will go to my friend\'s house to play.', 'Bukas, pupunta ako sa bahay ng aking kaibigan para maglaro.')
-        elif 'gahapon' in bisaya_lower or 'yesterday' in english_lower:
-            beginner = make_example('Gahapon ko moadto.', 'I went yesterday.', 'Pumunta ako kahapon.')
-            intermediate = make_example('Gahapon, nakaon ko sa balay.', 'Yesterday, I ate at home.', 'Kahapon, kumain ako sa bahay.')
-            advanced = make_example('Gahapon, nakaon ko sa balay sa akong higala ug nagdula mi.', 'Yesterday, I ate at my friend\'s house and we played.', 'Kahapon, kumain ako sa bahay ng aking kaibigan at naglaro kami.')
-        else:
-            english_clean = english.split('/')[0].split('(')[0].strip().lower()
-            tag_clean = tagalog.lower() if tagalog else ''
-            beginner = make_example(f'{bisaya} ko moadto.', f'I will go {english_clean}.', f'Pupunta ako {tag_clean}.' if tag_clean else '')
-            intermediate = make_example(f'{bisaya}, moadto ko sa balay.', f'{english_clean.capitalize()}, I will go to the house.', f'{tag_clean.capitalize()}, pupunta ako sa bahay.' if tag_clean else '')
-            advanced = make_example(f'{bisaya}, moadto ko sa balay sa akong higala.', f'{english_clean.capitalize()}, I will go to my friend\'s house.', f'{tag_clean.capitalize()}, pupunta ako sa bahay ng aking kaibigan.' if tag_clean else '')
+    # Only a handful of distinct tags, so share one string object per tag
+    if isinstance(pos, str):
+        pos = sys.intern(pos)
     
-    # Questions
-    elif 'question' in pos_lower or any(q in bisaya_lower for q in ['asa', 'unsa', 'kamus-a', 'ngano']):
-        if 'asa' in bisaya_lower or 'where' in english_lower:
-            beginner = make_example('Asa ka?', 'Where are you?', 'Nasaan ka?')
-            intermediate = make_example('Asa ka moadto?', 'Where are you going?', 'Saan ka pupunta?')
-            advanced = make_example('Asa ka moadto karon nga adlaw?', 'Where are you going today?', 'Saan ka pupunta ngayon?')
-        elif 'unsa' in bisaya_lower or 'what' in english_lower:
-            beginner = make_example('Unsa ni?', 'What is this?', 'Ano ito?')
-            intermediate = make_example('Unsa ang imong gusto?', 'What do you want?', 'Ano ang gusto mo?')
-            advanced = make_example('Unsa ang imong gusto nga mokaon karon?', 'What do you want to eat now?', 'Ano ang gusto mong kainin ngayon?')
-        elif 'kanus-a' in bisaya_lower or 'when' in english_lower:
-            beginner = make_example('Kanus-a ka moadto?', 'When will you go?', 'Kailan ka pupunta?')
-            intermediate = make_example('Kanus-a ka moadto sa balay?', 'When will you go to the house?', 'Kailan ka pupunta sa bahay?')
-            advanced = make_example('Kanus-a ka moadto sa balay sa akong higala?', 'When will you go to my friend\'s house?', 'Kailan ka pupunta sa bahay ng aking kaibigan?')
-        elif 'ngano' in bisaya_lower or 'why' in english_lower:
-            beginner = make_example('Ngano ka moadto?', 'Why are you going?', 'Bakit ka pupunta?')
-            intermediate = make_example('Ngano ka moadto sa balay?', 'Why are you going to the house?', 'Bakit ka pupunta sa bahay?')
-            advanced = make_example('Ngano ka moadto sa balay sa akong higala karon?', 'Why are you going to my friend\'s house now?', 'Bakit ka pupunta sa bahay ng aking kaibigan ngayon?')
-        else:
-            english_clean = english.split('/')[0].split('(')[0].strip()
-            tag_clean = tagalog if tagalog else ''
-            beginner = make_example(f'{bisaya}?', f'{english_clean}?', f'{tag_clean}?' if tag_clean else '')
-            intermediate = make_example(f'{bisaya} ka moadto?', f'{english_clean} are you going?', f'{tag_clean} ka pupunta?' if tag_clean else '')
-            advanced = make_example(f'{bisaya} ka moadto sa balay?', f'{english_clean} are you going to the house?', f'{tag_clean} ka pupunta sa bahay?' if tag_clean else '')
+    # Determine category
+    category = determine_category(pos, english)
     
-    # Default/Generic patterns
-    else:
-        english_clean = english.split('/')[0].split('(')[0].strip()
-        tag_clean = tagalog if tagalog else ''
-        if is_phrase:
-            beginner = make_example(f'{bisaya}.', f'{english_clean}.', f'{tag_clean}.' if tag_clean else '')
-            intermediate = make_example(f'{bisaya}, mahimo ba?', f'{english_clean}, is it possible?', f'{tag_clean}, posible ba?' if tag_clean else '')
-            advanced = make_example(f'{bisaya}, mahimo ba nimo ko tabangan?', f'{english_clean}, can you help me?', f'{tag_clean}, maaari mo ba akong tulungan?' if tag_clean else '')
-        else:
-            beginner = make_example(f'{bisaya} na.', f'{english_clean} now.', f'{tag_clean} ngayon.' if tag_clean else '')
-            intermediate = make_example(f'Gusto ko ug {bisaya}.', f'I want {english_clean.lower()}.', f'Gusto ko ng {tag_clean.lower()}.' if tag_clean else '')
-            advanced = make_example(f'Gipalit nako ang {bisaya} sa tindahan.', f'I bought the {english_clean.lower()} at the store.', f'Binili ko ang {tag_clean.lower()} sa tindahan.' if tag_clean else '')
+    # Generate examples
+    try:
+        examples = _generate_examples_cached(bisaya, tagalog or '', english, pos)
+    except Exception as e:
+        print(f'⚠️ Error generating examples for {bisaya}: {e}')
+        eng_clean = english.split('/', 1)[0].split('(', 1)[0].strip()
+        examples = fill_templates(
+            GENERIC_PHRASE_TEMPLATES, {'bisaya': bisaya, 'english': eng_clean, 'tagalog': tagalog or ''}, bool(tagalog))
     
-    return beginner, intermediate, advanced
+    # Nine example columns: beginner, intermediate, advanced x bisaya, english, tagalog
+    return [bisaya, tagalog, english, pos, pronunciation, category, *itertools.chain.from_iterable(examples)]
 
-def determine_category(pos: str, english: str) -> str:
-    """Determine category based on part of speech and meaning."""
-    pos_lower = pos.lower()
-    english_lower = english.lower()
-    
-    if 'greeting' in pos_lower:
-        return 'Greetings'
-    elif 'expression' in pos_lower or 'response' in pos_lower:
-        return 'Common Phrases'
-    elif 'number' in pos_lower:
-        return 'Numbers'
-    elif 'verb' in pos_lower:
-        if any(f in english_lower for f in ['eat', 'drink', 'cook', 'food']):
-            return 'Food & Dining'
-        elif any(f in english_lower for f in ['buy', 'sell', 'market', 'shop']):
-            return 'Market/Shopping'
-        else:
-            return 'Actions'
-    elif 'noun' in pos_lower:
-        if any(f in english_lower for f in ['father', 'mother', 'family', 'brother', 'sister']):
-            return 'Family'
-        elif any(f in english_lower for f in ['food', 'water', 'rice', 'bread', 'fruit']):
-            return 'Food & Dining'
-        elif any(f in english_lower for f in ['house', 'room', 'door', 'window']):
-            return 'Home & Living'
-        elif any(f in english_lower for f in ['book', 'school', 'student', 'teacher']):
-            return 'Education'
-        else:
-            return 'Common Nouns'
-    elif 'adjective' in pos_lower:
-        return 'Descriptions'
-    elif 'time' in pos_lower or any(t in english_lower for t in ['now', 'today', 'tomorrow', 'yesterday', 'day', 'month', 'year']):
-        return 'Time'
-    elif 'question' in pos_lower:
-        return 'Questions'
-    else:
-        return 'Uncategorized'
+# Below this many entries, starting worker processes costs more than it saves
+PARALLEL_MIN_ROWS = 2000
+
+def build_rows_chunk(chunk: List[Dict]) -> List[List[str]]:
+    """Build the CSV rows for a slice of metadata (runs in a worker process)."""
+    return [row for row in map(build_row, chunk) if row is not None]
 
 def main():
     # Paths
@@ -398,82 +834,34 @@ def main():
     metadata = load_metadata(metadata_path)
     print(f'✅ Loaded {len(metadata)} words')
     
-    # Prepare CSV data
-    csv_data = []
-    csv_data.append([
-        'Bisaya',
-        'Tagalog',
-        'English',
-        'Part of Speech',
-        'Pronunciation',
-        'Category',
-        'Beginner Example (Bisaya)',
-        'Beginner English Translation',
-        'Beginner Tagalog Translation',
-        'Intermediate Example (Bisaya)',
-        'Intermediate English Translation',
-        'Intermediate Tagalog Translation',
-        'Advanced Example (Bisaya)',
-        'Advanced English Translation',
-        'Advanced Tagalog Translation'
-    ])
-    
+    # Rows go into the CSV buffer as they are produced; the file gets one write at the end
     print('📝 Generating examples for each word...')
-    for i, word_data in enumerate(metadata):
-        bisaya = word_data.get('bisaya', '')
-        tagalog = word_data.get('tagalog', '')
-        english = word_data.get('english', '')
-        pronunciation = word_data.get('pronunciation', '')
-        pos = word_data.get('pos', 'Unknown')
-        
-        if not bisaya or not english:
-            continue
-        
-        # Determine category
-        category = determine_category(pos, english)
-        
-        # Generate examples
-        try:
-            beginner_tuple, intermediate_tuple, advanced_tuple = generate_examples(bisaya, tagalog, english, pos, category)
-        except Exception as e:
-            print(f'⚠️ Error generating examples for {bisaya}: {e}')
-            eng_clean = english.split('/')[0].split('(')[0].strip()
-            tag_clean = tagalog if tagalog else ''
-            beginner_tuple = make_example(f'{bisaya}.', f'{eng_clean}.', f'{tag_clean}.' if tag_clean else '')
-            intermediate_tuple = make_example(f'{bisaya}, mahimo ba?', f'{eng_clean}, is it possible?', f'{tag_clean}, posible ba?' if tag_clean else '')
-            advanced_tuple = make_example(f'{bisaya}, mahimo ba nimo ko tabangan?', f'{eng_clean}, can you help me?', f'{tag_clean}, maaari mo ba akong tulungan?' if tag_clean else '')
-        
-        # Unpack tuples
-        beginner_bisaya, beginner_english, beginner_tagalog = beginner_tuple
-        intermediate_bisaya, intermediate_english, intermediate_tagalog = intermediate_tuple
-        advanced_bisaya, advanced_english, advanced_tagalog = advanced_tuple
-        
-        csv_data.append([
-            bisaya,
-            tagalog,
-            english,
-            pos,
-            pronunciation,
-            category,
-            beginner_bisaya,
-            beginner_english,
-            beginner_tagalog,
-            intermediate_bisaya,
-            intermediate_english,
-            intermediate_tagalog,
-            advanced_bisaya,
-            advanced_english,
-            advanced_tagalog
-        ])
-        
-        if (i + 1) % 50 == 0:
-            print(f'  Processed {i + 1}/{len(metadata)} words...')
+    buffer = io.StringIO(newline='')
+    writer = csv.writer(buffer)
+    writer.writerow(CSV_HEADER)
+    row_count = 0
+    if len(metadata) >= PARALLEL_MIN_ROWS:
+        # Rows are independent, so split the metadata across all cores
+        workers = os.cpu_count() or 1
+        chunk_size = -(-len(metadata) // workers)
+        chunks = [metadata[i:i + chunk_size] for i in range(0, len(metadata), chunk_size)]
+        print(f'  Using {len(chunks)} worker processes...')
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for chunk_rows in executor.map(build_rows_chunk, chunks):
+                writer.writerows(chunk_rows)
+                row_count += len(chunk_rows)
+                print(f'  Processed {row_count}/{len(metadata)} words...')
+    else:
+        for row in map(build_row, metadata):
+            if row is not None:
+                writer.writerow(row)
+                row_count += 1
+        print(f'  Processed {len(metadata)}/{len(metadata)} words...')
     
     # Write CSV file to temp location first
     print(f'💾 Writing CSV to {temp_path}...')
     with open(temp_path, 'w', encoding='utf-8', newline='') as f:
-        writer = csv.writer(f)
-        writer.writerows(csv_data)
+        f.write(buffer.getvalue())
     
     # Try to replace the original file
     import shutil
@@ -488,7 +876,7 @@ def main():
         
         # Replace with new file
         shutil.move(temp_path, output_path)
-        print(f'✅ Successfully generated {output_path} with {len(csv_data) - 1} entries!')
+        print(f'✅ Successfully generated {output_path} with {row_count} entries!')
     except PermissionError:
         print(f'⚠️  Could not replace {output_path} (file may be open in another program)')
         print(f'✅ New file saved as: {temp_path}')
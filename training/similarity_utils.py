@@ -0,0 +1,120 @@
+"""
+Similarity and JSON export helpers shared by train_model.py, train_json_model.py and
+train_tflite_model.py
+(train_tflite_colab.py keeps its own copies so it can be uploaded to Colab on its own)
+"""
+
+import json
+import numpy as np
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+def json_floats(vector):
+    """Vector as a list of floats rounded to 6 decimal places for compact JSON
+    
+    The cut is absolute, so small components keep fewer significant digits than float32 holds.
+    """
+    return np.round(np.asarray(vector, dtype=np.float64), 6).tolist()
+
+if NUMBA_AVAILABLE:
+    # Every fast-math flag except nnan/ninf: the kept scores start at -inf, and under ninf
+    # comparing against that seed would be undefined
+    @njit(parallel=True, fastmath={'nsz', 'arcp', 'contract', 'afn', 'reassoc'}, cache=True)
+    def topk_cosine(E, k, out_idx, out_score):
+        """Top-k dot products of each unit row of E against all others, without a V x V matrix"""
+        V, D = E.shape
+        for i in prange(V):
+            scores = out_score[i]
+            idx = out_idx[i]
+            scores[:] = -np.inf
+            idx[:] = -1
+            worst = 0
+            for j in range(V):
+                if j == i:
+                    continue
+                s = 0.0
+                for d in range(D):
+                    s += E[i, d] * E[j, d]
+                if s > scores[worst]:
+                    # Replace the current lowest of the k kept scores
+                    scores[worst] = s
+                    idx[worst] = j
+                    worst = 0
+                    for m in range(1, k):
+                        if scores[m] < scores[worst]:
+                            worst = m
+            # Order the k kept scores from most to least similar (k is small)
+            for m in range(1, k):
+                s = scores[m]
+                j = idx[m]
+                n = m - 1
+                while n >= 0 and scores[n] < s:
+                    scores[n + 1] = scores[n]
+                    idx[n + 1] = idx[n]
+                    n -= 1
+                scores[n + 1] = s
+                idx[n + 1] = j
+
+# Rows scored per step on the numpy path, so only a block x V slice of the similarity matrix exists at a time
+SIMILARITY_BLOCK_ROWS = 1024
+
+def dot_block(embeddings, start, stop):
+    """Dot products of rows start:stop against every row (cosine similarities for unit rows)"""
+    return embeddings[start:stop] @ embeddings.T
+
+def top_k_similar(embeddings, k, score_block=dot_block):
+    """Indices and scores of the k most similar rows for every row of unit vectors, best first
+    
+    score_block(embeddings, start, stop) scores a block of rows against all rows when numba is missing
+    """
+    if NUMBA_AVAILABLE:
+        # One parallel pass keeping a running top-k per row, so no similarity rows are materialized
+        top_idx = np.empty((len(embeddings), k), dtype=np.int32)
+        top_scores = np.empty((len(embeddings), k), dtype=np.float32)
+        topk_cosine(embeddings, k, top_idx, top_scores)
+        return top_idx, top_scores
+    
+    # Partition out each row's top k block by block, then sort just those
+    top_idx = np.empty((len(embeddings), k), dtype=np.intp)
+    top_scores = np.empty((len(embeddings), k), dtype=np.float32)
+    for start in range(0, len(embeddings), SIMILARITY_BLOCK_ROWS):
+        stop = min(start + SIMILARITY_BLOCK_ROWS, len(embeddings))
+        block_scores = score_block(embeddings, start, stop)
+        rows = np.arange(stop - start)
+        block_scores[rows, rows + start] = -np.inf  # Don't include self-similarity
+        block_idx = np.argpartition(block_scores, -k, axis=1)[:, -k:]
+        top_idx[start:stop] = block_idx
+        top_scores[start:stop] = np.take_along_axis(block_scores, block_idx, axis=1)
+    order = np.argsort(-top_scores, axis=1)
+    return np.take_along_axis(top_idx, order, axis=1), np.take_along_axis(top_scores, order, axis=1)
+
+def similarity_rows(words, top_idx, top_scores, ndigits=6):
+    """(word, {similar_word: score}) pairs from the top-k arrays, one row at a time"""
+    # A word listed on several rows keeps its last row, as a dict built from all rows would
+    last_row = {word: i for i, word in enumerate(words)}
+    for i, (word, idx_row, score_row) in enumerate(zip(words, top_idx, top_scores)):
+        if last_row[word] == i:
+            yield word, {words[j]: round(s, ndigits) for j, s in zip(idx_row.tolist(), score_row.tolist())}
+
+def json_dumps(value):
+    """Compact UTF-8 JSON bytes (int keys such as index_to_word's become strings)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+def write_json_object(f, items):
+    """Write (key, value) pairs as a JSON object, encoding one entry at a time"""
+    f.write(b'{')
+    for i, (key, value) in enumerate(items):
+        if i:
+            f.write(b',')
+        f.write(json_dumps(key) + b':' + json_dumps(value))
+    f.write(b'}')
@@ -7,11 +7,11 @@ This is a lightweight alternative that works with any Python version
 
 import pandas as pd
 import numpy as np
-from gensim.models import Word2Vec
-from sklearn.metrics.pairwise import cosine_similarity
-import json
+from gensim.models import KeyedVectors, Word2Vec
+import hashlib
 import os
 from pathlib import Path
+from similarity_utils import json_dumps, json_floats, similarity_rows, top_k_similar, write_json_object
 
 def load_dataset(csv_path):
     """Load the Bisaya dataset from CSV"""
@@ -19,121 +19,161 @@ def load_dataset(csv_path):
     print(f"✅ Loaded {len(df)} entries from dataset")
     return df
 
+def column_tokens(df, column):
+    """Lower-cased tokens of every cell in a column (missing cells give [])"""
+    return df.get(column, pd.Series('', index=df.index)).fillna('').astype(str).str.lower().str.split()
+
 def prepare_training_data(df):
     """Prepare text data for training embeddings"""
-    all_texts = []
-    
-    for _, row in df.iterrows():
-        bisaya = str(row['Bisaya']).lower().split()
-        tagalog = str(row['Tagalog']).lower().split() if pd.notna(row.get('Tagalog')) else []
-        english = str(row['English']).lower().split()
-        
-        if bisaya and bisaya[0] != 'nan':
-            all_texts.append(bisaya)
-        if tagalog and tagalog and tagalog[0] != 'nan':
-            all_texts.append(tagalog)
-        if english and english[0] != 'nan':
-            all_texts.append(english)
-    
-    return all_texts
+    bisaya = column_tokens(df, 'Bisaya').tolist()
+    tagalog = column_tokens(df, 'Tagalog').tolist()
+    english = column_tokens(df, 'English').tolist()
+    
+    # Keep each row's Bisaya, Tagalog and English sentences next to each other
+    all_texts = [
+        tokens
+        for row_tokens in zip(bisaya, tagalog, english)
+        for tokens in row_tokens
+        if tokens and tokens[0] != 'nan'
+    ]
+    
+    # Exact duplicate sentences add no new contexts, only training time (first occurrence kept)
+    unique_texts = [list(tokens) for tokens in dict.fromkeys(map(tuple, all_texts))]
+    print(f"🧹 Kept {len(unique_texts)} of {len(all_texts)} sentences after removing duplicates")
+    return unique_texts
+
+# Word2Vec settings that shape the vectors (also part of the embedding cache key).
+# min_count=1 and skip-gram are deliberate for this small, low-resource vocabulary.
+WORD2VEC_PARAMS = {
+    'vector_size': 100,
+    'window': 5,
+    'min_count': 1,
+    'sg': 1,
+    'hs': 0,  # Negative sampling instead of hierarchical softmax
+    'negative': 5,
+    'epochs': 5,
+}
 
 def train_embeddings(training_data):
     """Train Word2Vec embeddings model"""
     print(f"📚 Training Word2Vec model on {len(training_data)} sentences...")
     
-    model = Word2Vec(
-        sentences=training_data,
-        vector_size=100,
-        window=5,
-        min_count=1,
-        workers=4,
-        sg=1
-    )
+    # Leave one core free; gensim's training threads run without the GIL
+    workers = max(1, (os.cpu_count() or 4) - 1)
+    model = Word2Vec(sentences=training_data, workers=workers, **WORD2VEC_PARAMS)
     
     print("✅ Model training completed!")
     return model
 
-def generate_embeddings(word2vec_model, df):
+def load_or_train_embeddings(training_data, cache_dir):
+    """Reuse word vectors trained on the same sentences, otherwise train and cache them"""
+    digest = hashlib.blake2b(repr(sorted(WORD2VEC_PARAMS.items())).encode('utf-8'), digest_size=16)
+    for sentence in training_data:
+        digest.update(' '.join(sentence).encode('utf-8'))
+        digest.update(b'\n')
+    cache_path = cache_dir / f'w2v_{digest.hexdigest()}.kv'
+    
+    if cache_path.exists():
+        print(f"♻️  Training data unchanged, loading cached embeddings from {cache_path}")
+        return KeyedVectors.load(str(cache_path), mmap='r')
+    
+    # Only the word vectors are used afterwards, not the trainer state
+    word_vectors = train_embeddings(training_data).wv
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    word_vectors.save(str(cache_path))
+    return word_vectors
+
+def text_column(df, column, default):
+    """Stripped text of every cell in a column, using default for missing cells or columns"""
+    if column not in df:
+        return [default] * len(df)
+    values = df[column]
+    return values.astype(str).str.strip().where(values.notna(), default).tolist()
+
+def generate_embeddings(word_vectors, df):
     """Generate embeddings for all words in dataset"""
     print("🔍 Generating embeddings...")
     
     embeddings = {}
     metadata_list = []
-    
-    for idx, (_, row) in enumerate(df.iterrows()):
-        bisaya = str(row['Bisaya']).strip()
+    # Index the contiguous vocab matrix directly instead of going through wv[...] per word
+    vocab = word_vectors.key_to_index
+    vectors = word_vectors.vectors
+    zero_embedding = [0.0] * vectors.shape[1]
+    
+    # Clean every column once instead of boxing each row with iterrows()
+    bisaya_col = df['Bisaya'].astype(str).str.strip().tolist()
+    english_col = df['English'].astype(str).str.strip().tolist()
+    tagalog_col = text_column(df, 'Tagalog', '')
+    pronunciation_col = text_column(df, 'Pronunciation', '')
+    pos_col = text_column(df, 'Part of Speech', 'Unknown')
+    category_col = text_column(df, 'Category', 'Uncategorized')
+    
+    for bisaya, english, tagalog, pronunciation, pos, category in zip(
+            bisaya_col, english_col, tagalog_col, pronunciation_col, pos_col, category_col):
         if not bisaya or bisaya == 'nan':
             continue
             
         bisaya_lower = bisaya.lower()
         
-        # Get or create embedding
-        if bisaya_lower in word2vec_model.wv:
-            embedding = word2vec_model.wv[bisaya_lower].tolist()
+        # Get or create embedding; only phrases missing from the vocab need splitting
+        if bisaya_lower in vocab:
+            embedding = json_floats(vectors[vocab[bisaya_lower]])
         else:
             # For multi-word phrases, average word embeddings
-            words = bisaya_lower.split()
-            word_embeddings = [word2vec_model.wv[w] for w in words if w in word2vec_model.wv]
-            if word_embeddings:
-                embedding = np.mean(word_embeddings, axis=0).tolist()
-            else:
-                embedding = [0.0] * 100
+            idx = np.fromiter((vocab[w] for w in bisaya_lower.split() if w in vocab), dtype=np.int32)
+            embedding = json_floats(vectors[idx].mean(axis=0)) if idx.size else zero_embedding
         
         embeddings[bisaya_lower] = embedding
         
         metadata_list.append({
             'bisaya': bisaya,
-            'tagalog': str(row['Tagalog']).strip() if pd.notna(row.get('Tagalog')) else '',
-            'english': str(row['English']).strip(),
-            'pronunciation': str(row['Pronunciation']).strip() if pd.notna(row.get('Pronunciation')) else '',
-            'pos': str(row['Part of Speech']).strip() if pd.notna(row.get('Part of Speech')) else 'Unknown',
-            'category': str(row['Category']).strip() if pd.notna(row.get('Category')) else 'Uncategorized',
+            'tagalog': tagalog,
+            'english': english,
+            'pronunciation': pronunciation,
+            'pos': pos,
+            'category': category,
         })
     
     print(f"✅ Generated embeddings for {len(embeddings)} words")
     return embeddings, metadata_list
 
-def calculate_similarity_matrix(embeddings_dict):
-    """Pre-compute similarity matrix for fast lookup"""
+def calculate_similarity_matrix(embeddings_dict, top_k=10):
+    """Pre-compute the top similar words as (words, top_idx, top_scores) arrays"""
     print("📊 Calculating similarity matrix...")
     
     words = list(embeddings_dict.keys())
-    embeddings = np.array([embeddings_dict[w] for w in words])
+    # The loaded Word2Vec vectors are float32 to begin with, so float32 loses nothing and halves
+    # the V x D matrix the top-k search reads
+    embeddings = np.asarray([embeddings_dict[w] for w in words], dtype=np.float32)
     
-    if len(embeddings) == 0:
-        return {}
+    # With fewer than two words there is nothing to compare (k = 0 gives empty rows)
+    k = max(0, min(top_k, len(words) - 1))
+    if k == 0:
+        return words, np.empty((len(words), 0), dtype=np.int32), np.empty((len(words), 0), dtype=np.float32)
     
-    similarity_matrix = cosine_similarity(embeddings)
+    # Cosine similarity is the dot product of unit vectors (zero vectors stay zero)
+    embeddings /= np.linalg.norm(embeddings, axis=1, keepdims=True) + 1e-12
     
-    # Create top similar words dictionary
-    top_similar = {}
-    for i, word in enumerate(words):
-        similarities = []
-        for j, other_word in enumerate(words):
-            if i != j:
-                similarities.append((other_word, float(similarity_matrix[i][j])))
-        similarities.sort(key=lambda x: x[1], reverse=True)
-        top_similar[word] = {w: s for w, s in similarities[:10]}
+    top_idx, top_scores = top_k_similar(embeddings, k)
     
-    print(f"✅ Calculated similarities for {len(top_similar)} words")
-    return top_similar
+    print(f"✅ Calculated similarities for {len(words)} words")
+    return words, top_idx, top_scores
 
 def save_model(embeddings, metadata_list, similarity, output_path):
-    """Save complete model as JSON"""
+    """Save complete model as JSON (similarity is the tuple from calculate_similarity_matrix)"""
     print(f"💾 Saving model to {output_path}...")
     
-    model_data = {
-        'embeddings': embeddings,
-        'metadata': metadata_list,
-        'similarity': similarity,
-        'vocab_size': len(embeddings),
-        'embedding_dim': 100,
-        'version': '2.0.0',
-        'format': 'json'
-    }
-    
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(model_data, f, ensure_ascii=False, indent=2)
+    # Written section by section so the whole model never exists as one Python dict or buffer.
+    # Compact output: indentation roughly doubled the file the app has to load.
+    with open(output_path, 'wb') as f:
+        f.write(b'{"embeddings":')
+        write_json_object(f, embeddings.items())
+        f.write(b',"metadata":' + json_dumps(metadata_list))
+        f.write(b',"similarity":')
+        write_json_object(f, similarity_rows(*similarity))
+        f.write(b',"vocab_size":' + json_dumps(len(embeddings)))
+        f.write(b',"embedding_dim":100,"version":"2.0.0","format":"json"}')
     
     file_size_kb = os.path.getsize(output_path) / 1024
     print(f"✅ Model saved: {output_path}")
@@ -146,6 +186,7 @@ def main():
     output_dir = base_dir / 'assets' / 'models'
     output_dir.mkdir(parents=True, exist_ok=True)
     model_path = output_dir / 'bisaya_model.json'
+    cache_dir = Path(__file__).parent / '.w2v_cache'  # Kept out of the app's assets
     
     print("🚀 Starting Bisaya NLP Model Training (JSON Format)")
     print("=" * 60)
@@ -162,11 +203,11 @@ def main():
     # Prepare training data
     training_data = prepare_training_data(df)
     
-    # Train Word2Vec model
-    word2vec_model = train_embeddings(training_data)
+    # Train Word2Vec model (skipped when the training data has not changed)
+    word_vectors = load_or_train_embeddings(training_data, cache_dir)
     
     # Generate embeddings
-    embeddings, metadata_list = generate_embeddings(word2vec_model, df)
+    embeddings, metadata_list = generate_embeddings(word_vectors, df)
     
     # Calculate similarity matrix
     similarity = calculate_similarity_matrix(embeddings)
@@ -6,10 +6,9 @@ Generates word embeddings and exports to JSON format for Flutter
 import pandas as pd
 import numpy as np
 from gensim.models import Word2Vec, FastText
-from sklearn.metrics.pairwise import cosine_similarity
-import json
 import os
 from pathlib import Path
+from similarity_utils import json_dumps, json_floats, top_k_similar
 
 def load_dataset(csv_path):
     """Load the Bisaya dataset from CSV"""
@@ -17,49 +16,48 @@ def load_dataset(csv_path):
     print(f"Loaded {len(df)} entries from dataset")
     return df
 
+def column_tokens(df, column):
+    """Lower-cased tokens of every cell in a column (missing cells give [])"""
+    return df[column].fillna('').astype(str).str.lower().str.split()
+
 def prepare_training_data(df):
     """Prepare text data for training embeddings"""
     # Combine all language versions for richer context
-    all_texts = []
-    
-    for _, row in df.iterrows():
-        # Create sentences from each language
-        bisaya = str(row['Bisaya']).lower().split()
-        tagalog = str(row['Tagalog']).lower().split()
-        english = str(row['English']).lower().split()
-        
-        # Add each as a sentence for training
-        if bisaya and bisaya[0] != 'nan':
-            all_texts.append(bisaya)
-        if tagalog and tagalog[0] != 'nan':
-            all_texts.append(tagalog)
-        if english and english[0] != 'nan':
-            all_texts.append(english)
-    
-    return all_texts
+    bisaya = column_tokens(df, 'Bisaya').tolist()
+    tagalog = column_tokens(df, 'Tagalog').tolist()
+    english = column_tokens(df, 'English').tolist()
+    
+    # Add each as a sentence for training, row by row
+    all_texts = [
+        tokens
+        for row_tokens in zip(bisaya, tagalog, english)
+        for tokens in row_tokens
+        if tokens and tokens[0] != 'nan'
+    ]
+    
+    # Exact duplicate sentences add no new contexts, only training time (first occurrence kept)
+    unique_texts = [list(tokens) for tokens in dict.fromkeys(map(tuple, all_texts))]
+    print(f"Kept {len(unique_texts)} of {len(all_texts)} sentences after removing duplicates")
+    return unique_texts
 
 def train_embeddings(training_data, model_type='word2vec'):
     """Train word embeddings model"""
     print(f"Training {model_type} model on {len(training_data)} sentences...")
     
-    if model_type == 'word2vec':
-        model = Word2Vec(
-            sentences=training_data,
-            vector_size=100,  # Embedding dimension
-            window=5,  # Context window
-            min_count=1,  # Minimum word frequency
-            workers=4,
-            sg=1  # Skip-gram
-        )
-    else:  # fasttext
-        model = FastText(
-            sentences=training_data,
-            vector_size=100,
-            window=5,
-            min_count=1,
-            workers=4,
-            sg=1
-        )
+    # Leave one core free; gensim's training threads run without the GIL
+    workers = max(1, (os.cpu_count() or 4) - 1)
+    model_class = Word2Vec if model_type == 'word2vec' else FastText
+    model = model_class(
+        sentences=training_data,
+        vector_size=100,  # Embedding dimension
+        window=5,  # Context window
+        min_count=1,  # Keep every word: the vocabulary is small and low-resource
+        workers=workers,
+        sg=1,  # Skip-gram, which does better than CBOW on rare words
+        hs=0,  # Negative sampling instead of hierarchical softmax
+        negative=5,
+        epochs=5
+    )
     
     print("Model training completed!")
     return model
@@ -68,30 +66,33 @@ def generate_embeddings(model, df):
     """Generate embeddings for all words in dataset"""
     embeddings = {}
     metadata = {}
-    
-    for _, row in df.iterrows():
-        bisaya = str(row['Bisaya']).strip()
-        tagalog = str(row['Tagalog']).strip()
-        english = str(row['English']).strip()
-        pos = str(row['Part of Speech']).strip()
-        pronunciation = str(row['Pronunciation']).strip()
-        
+    # Index the contiguous vocab matrix directly instead of going through wv[...] per word
+    vocab = model.wv.key_to_index
+    vectors = model.wv.vectors
+    zero_embedding = [0.0] * model.vector_size
+    
+    # Clean every column once instead of boxing each row with iterrows()
+    columns = [
+        df[column].astype(str).str.strip().tolist()
+        for column in ('Bisaya', 'Tagalog', 'English', 'Part of Speech', 'Pronunciation')
+    ]
+    
+    for bisaya, tagalog, english, pos, pronunciation in zip(*columns):
         # Get embedding for Bisaya word (primary key)
         if bisaya and bisaya != 'nan':
             bisaya_lower = bisaya.lower()
             
-            # Try to get embedding, use average if word not found
-            if bisaya_lower in model.wv:
-                embedding = model.wv[bisaya_lower].tolist()
+            # Try to get embedding, use average if word not found (only then is the word split)
+            if bisaya_lower in vocab:
+                embedding = json_floats(vectors[vocab[bisaya_lower]])
+            elif isinstance(model, FastText):
+                # FastText builds vectors for unseen words from character n-grams
+                embedding = json_floats(model.wv[bisaya_lower])
             else:
-                # If word not in vocab, try to get embedding for individual words
-                words = bisaya_lower.split()
-                word_embeddings = [model.wv[w] for w in words if w in model.wv]
-                if word_embeddings:
-                    embedding = np.mean(word_embeddings, axis=0).tolist()
-                else:
-                    # Use zero vector as fallback
-                    embedding = [0.0] * model.vector_size
+                # If word not in vocab, average the embeddings of its individual words
+                idx = np.fromiter((vocab[w] for w in bisaya_lower.split() if w in vocab), dtype=np.int32)
+                # Use zero vector as fallback
+                embedding = json_floats(vectors[idx].mean(axis=0)) if idx.size else zero_embedding
             
             embeddings[bisaya_lower] = embedding
             
@@ -105,48 +106,49 @@ def generate_embeddings(model, df):
     
     return embeddings, metadata
 
-def calculate_similarity_matrix(embeddings):
-    """Calculate similarity matrix for all word pairs"""
+def calculate_similarity_matrix(embeddings, top_k=10):
+    """Calculate the top similar words for every word as (words, top_idx, top_scores) arrays"""
     print("Calculating similarity matrix...")
     
     words = list(embeddings.keys())
-    embedding_matrix = np.array([embeddings[word] for word in words])
+    # Word2Vec and FastText both train float32 vectors (the JSON lists only round them), so the
+    # matrix is rebuilt at that precision rather than as float64 Python floats
+    embedding_matrix = np.asarray([embeddings[word] for word in words], dtype=np.float32)
     
-    # Calculate cosine similarity
-    similarity_matrix = cosine_similarity(embedding_matrix)
+    # With fewer than two words there is nothing to compare (k = 0 gives empty rows)
+    k = max(0, min(top_k, len(words) - 1))
+    if k == 0:
+        return words, np.empty((len(words), 0), dtype=np.int32), np.empty((len(words), 0), dtype=np.float32)
     
-    # Convert to dictionary for easier lookup
-    similarity_dict = {}
-    for i, word1 in enumerate(words):
-        similarity_dict[word1] = {}
-        for j, word2 in enumerate(words):
-            if i != j:  # Don't include self-similarity
-                similarity_dict[word1][word2] = float(similarity_matrix[i][j])
+    # Cosine similarity is the dot product of unit vectors (zero vectors stay zero)
+    embedding_matrix /= np.linalg.norm(embedding_matrix, axis=1, keepdims=True) + 1e-12
     
     # For each word, get top 10 most similar words
-    top_similar = {}
-    for word in words:
-        similar_words = sorted(
-            similarity_dict[word].items(),
-            key=lambda x: x[1],
-            reverse=True
-        )[:10]
-        top_similar[word] = {w: s for w, s in similar_words}
-    
-    return top_similar
+    top_idx, top_scores = top_k_similar(embedding_matrix, k)
+    return words, top_idx, top_scores
+
+def similarity_to_dict(words, top_idx, top_scores):
+    """Nested {word: {similar_word: score}} form of the top-k arrays, as stored in the JSON model"""
+    return {
+        word: {words[j]: round(s, 6) for j, s in zip(idx_row, score_row)}
+        for word, idx_row, score_row in zip(words, top_idx.tolist(), top_scores.tolist())
+    }
 
 def export_to_json(embeddings, metadata, similarity, output_path):
-    """Export model to JSON format"""
+    """Export model to JSON format (similarity is the tuple from calculate_similarity_matrix)"""
     model_data = {
         'embeddings': embeddings,
         'metadata': metadata,
-        'similarity': similarity,
+        'similarity': similarity_to_dict(*similarity),
         'version': '1.0.0',
         'total_words': len(embeddings)
     }
     
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(model_data, f, ensure_ascii=False, indent=2)
+    # Compact output: indentation roughly doubled the file the app has to load.
+    # Embeddings are already json_floats lists and similarity_to_dict unboxes the arrays,
+    # so the shared encoder needs no numpy support
+    with open(output_path, 'wb') as f:
+        f.write(json_dumps(model_data))
     
     print(f"Model exported to {output_path}")
     print(f"Total words: {len(embeddings)}")
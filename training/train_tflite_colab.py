@@ -5,13 +5,34 @@ Optimized for Google Colab - reads from and saves to Google Drive
 
 import pandas as pd
 import numpy as np
-from gensim.models import Word2Vec
-from sklearn.metrics.pairwise import cosine_similarity
+from gensim.models import Word2Vec, word2vec
+import hashlib
 import json
 import os
+import tempfile
 from pathlib import Path
 import tensorflow as tf
 from google.colab import drive
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+try:
+    import simsimd
+    SIMSIMD_AVAILABLE = True
+except ImportError:
+    SIMSIMD_AVAILABLE = False
+try:
+    import cupy as cp
+    CUPY_AVAILABLE = cp.cuda.runtime.getDeviceCount() > 0
+except Exception:  # Not installed, or no GPU runtime attached to this Colab session
+    CUPY_AVAILABLE = False
 
 def mount_google_drive():
     """Mount Google Drive to access files"""
@@ -58,50 +79,110 @@ def load_dataset_from_drive(folder_name='AAA'):
     return df, drive_path
 
 
+def column_sentences(df, column):
+    """Lower-cased, single-spaced text of every cell in a column (missing cells or columns give '')"""
+    return df.get(column, pd.Series('', index=df.index)).fillna('').astype(str).str.lower().str.split().str.join(' ')
+
 def prepare_training_data(df):
     """Prepare text data for training embeddings"""
-    all_texts = []
-    
-    for _, row in df.iterrows():
-        # Handle NaN values safely and convert to list of words
-        bisaya = str(row.get('Bisaya', '')).lower().strip()
-        tagalog = str(row.get('Tagalog', '')).lower().strip() if pd.notna(row.get('Tagalog')) else ''
-        english = str(row.get('English', '')).lower().strip()
-        
-        # Split into words and filter out empty/nan values
-        if bisaya and bisaya != 'nan' and bisaya:
-            bisaya_words = bisaya.split()
-            if bisaya_words:
-                all_texts.append(bisaya_words)
-        
-        if tagalog and tagalog != 'nan' and tagalog:
-            tagalog_words = tagalog.split()
-            if tagalog_words:
-                all_texts.append(tagalog_words)
-        
-        if english and english != 'nan' and english:
-            english_words = english.split()
-            if english_words:
-                all_texts.append(english_words)
-    
-    return all_texts
+    # Handle NaN values up front and normalize whole columns into space-separated sentences.
+    # Flat strings instead of lists of word lists: the corpus file is then one join away
+    bisaya = column_sentences(df, 'Bisaya').tolist()
+    tagalog = column_sentences(df, 'Tagalog').tolist()
+    english = column_sentences(df, 'English').tolist()
+    
+    # Filter out empty/'nan' cells, keeping one sentence per language row by row
+    return [
+        sentence
+        for row_sentences in zip(bisaya, tagalog, english)
+        for sentence in row_sentences
+        if sentence and sentence != 'nan'
+    ]
+
+# Word2Vec settings that shape the vectors (also part of the model cache key)
+WORD2VEC_PARAMS = {
+    'vector_size': 100,
+    'window': 5,
+    'min_count': 1,
+    'sg': 1,
+}
 
 def train_embeddings(training_data):
     """Train Word2Vec embeddings model"""
     print(f"🔄 Training Word2Vec model on {len(training_data)} sentences...")
     
-    model = Word2Vec(
-        sentences=training_data,
-        vector_size=100,
-        window=5,
-        min_count=1,
-        workers=4,
-        sg=1
-    )
+    if word2vec.FAST_VERSION < 0:
+        print("⚠️ gensim C extension not available; Word2Vec training will be very slow")
+    
+    # Train from a corpus file: each worker reads its own slice of the file without the GIL,
+    # so training scales with the cores instead of stalling on the sentence iterator
+    with tempfile.NamedTemporaryFile('w', encoding='utf-8', suffix='.txt', delete=False) as f:
+        f.write('\n'.join(training_data) + '\n')
+    try:
+        model = Word2Vec(corpus_file=f.name, workers=os.cpu_count() or 4, **WORD2VEC_PARAMS)
+    finally:
+        os.remove(f.name)
     
     print("✅ Model training completed!")
     return model
 
+def load_or_train_embeddings(training_data, cache_dir):
+    """Reuse a Word2Vec model trained on the same sentences, otherwise train and cache it"""
+    digest = hashlib.blake2b(repr(sorted(WORD2VEC_PARAMS.items())).encode('utf-8'), digest_size=16)
+    digest.update('\n'.join(training_data).encode('utf-8'))
+    cache_path = Path(cache_dir) / f'w2v_{digest.hexdigest()}.model'
+    
+    if cache_path.exists():
+        print(f"♻️ Training data unchanged, loading cached Word2Vec model from {cache_path}")
+        return Word2Vec.load(str(cache_path), mmap='r')
+    
+    model = train_embeddings(training_data)
+    Path(cache_dir).mkdir(parents=True, exist_ok=True)
+    model.save(str(cache_path))
+    return model
+
+# Example metadata fields, added when the dataset has the tier's Bisaya example column
+EXAMPLE_FIELDS = (
+    ('Beginner Example (Bisaya)', (
+        ('beginnerExample', 'Beginner Example (Bisaya)'),
+        ('beginnerEnglish', 'Beginner English Translation'),
+        ('beginnerTagalog', 'Beginner Tagalog Translation'),
+    )),
+    ('Intermediate Example (Bisaya)', (
+        ('intermediateExample', 'Intermediate Example (Bisaya)'),
+        ('intermediateEnglish', 'Intermediate English Translation'),
+        ('intermediateTagalog', 'Intermediate Tagalog Translation'),
+    )),
+    ('Advanced Example (Bisaya)', (
+        ('advancedExample', 'Advanced Example (Bisaya)'),
+        ('advancedEnglish', 'Advanced English Translation'),
+        ('advancedTagalog', 'Advanced Tagalog Translation'),
+    )),
+)
+
+def text_column(df, column, missing=''):
+    """Stripped text of every cell in a column; empty cells become missing, an absent column ''"""
+    if column not in df.columns:
+        return pd.Series('', index=df.index)
+    values = df[column]
+    return values.astype(str).str.strip().where(values.notna(), missing)
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def mean_embedding(word_ids, vectors):
+        """Mean of the rows of vectors listed in word_ids (non-empty), summed in a compiled loop"""
+        dim = vectors.shape[1]
+        out = np.zeros(dim, dtype=vectors.dtype)
+        for i in word_ids:
+            for d in range(dim):
+                out[d] += vectors[i, d]
+        out /= len(word_ids)  # in place, so the result keeps the vectors' float32 dtype
+        return out
+else:
+    def mean_embedding(word_ids, vectors):
+        """Mean of the rows of vectors listed in word_ids (non-empty)"""
+        return vectors[word_ids].mean(axis=0)
+
 def create_embedding_model(word2vec_model, df):
     """Create TensorFlow model for embeddings"""
     print("🔄 Creating TensorFlow embedding model...")
@@ -109,75 +190,56 @@ def create_embedding_model(word2vec_model, df):
     # Build vocabulary mapping
     word_to_index = {}
     index_to_word = {}
-    embeddings_list = []
-    metadata_list = []
-    
-    for idx, (_, row) in enumerate(df.iterrows()):
-        bisaya = str(row['Bisaya']).strip()
-        if bisaya and bisaya != 'nan':
-            bisaya_lower = bisaya.lower()
-            
-            # Get or create embedding
-            if bisaya_lower in word2vec_model.wv:
-                embedding = word2vec_model.wv[bisaya_lower]
-            else:
-                words = bisaya_lower.split()
-                word_embeddings = [word2vec_model.wv[w] for w in words if w in word2vec_model.wv]
-                if word_embeddings:
-                    embedding = np.mean(word_embeddings, axis=0)
-                else:
-                    embedding = np.zeros(100)
-            
-            word_to_index[bisaya_lower] = idx
-            index_to_word[idx] = bisaya_lower
-            embeddings_list.append(embedding)
-            
-            # Include example columns if available
-            metadata_entry = {
-                'bisaya': bisaya,
-                'tagalog': str(row.get('Tagalog', '')).strip() if pd.notna(row.get('Tagalog', '')) else '',
-                'english': str(row.get('English', '')).strip(),
-                'pronunciation': str(row.get('Pronunciation', '')).strip() if pd.notna(row.get('Pronunciation', '')) else '',
-                'pos': str(row.get('Part of Speech', '')).strip() if pd.notna(row.get('Part of Speech', '')) else '',
-            }
-            
-            # Add example columns if they exist in the dataset
-            try:
-                if 'Beginner Example (Bisaya)' in df.columns:
-                    val = row.get('Beginner Example (Bisaya)', '')
-                    metadata_entry['beginnerExample'] = str(val).strip() if pd.notna(val) else ''
-                    val = row.get('Beginner English Translation', '')
-                    metadata_entry['beginnerEnglish'] = str(val).strip() if pd.notna(val) else ''
-                    val = row.get('Beginner Tagalog Translation', '')
-                    metadata_entry['beginnerTagalog'] = str(val).strip() if pd.notna(val) else ''
-                
-                if 'Intermediate Example (Bisaya)' in df.columns:
-                    val = row.get('Intermediate Example (Bisaya)', '')
-                    metadata_entry['intermediateExample'] = str(val).strip() if pd.notna(val) else ''
-                    val = row.get('Intermediate English Translation', '')
-                    metadata_entry['intermediateEnglish'] = str(val).strip() if pd.notna(val) else ''
-                    val = row.get('Intermediate Tagalog Translation', '')
-                    metadata_entry['intermediateTagalog'] = str(val).strip() if pd.notna(val) else ''
-                
-                if 'Advanced Example (Bisaya)' in df.columns:
-                    val = row.get('Advanced Example (Bisaya)', '')
-                    metadata_entry['advancedExample'] = str(val).strip() if pd.notna(val) else ''
-                    val = row.get('Advanced English Translation', '')
-                    metadata_entry['advancedEnglish'] = str(val).strip() if pd.notna(val) else ''
-                    val = row.get('Advanced Tagalog Translation', '')
-                    metadata_entry['advancedTagalog'] = str(val).strip() if pd.notna(val) else ''
-            except Exception:
-                # If columns don't exist, just skip adding example fields
-                pass
-            
-            metadata_list.append(metadata_entry)
+    
+    # Gather vectors by row from Word2Vec's dense matrix instead of per-word wv[] lookups
+    vocab = word2vec_model.wv.key_to_index
+    vectors = np.asarray(word2vec_model.wv.vectors)  # plain ndarray view, even of a cached model's memmap
+    hit_rows = []  # embedding rows whose text is a Word2Vec word
+    hit_ids = []
+    phrase_embeddings = {}  # embedding row -> mean vector of its in-vocab words
+    
+    # Clean each column once instead of calling row.get()/pd.notna() per row and field
+    bisaya_col = df['Bisaya'].astype(str).str.strip()
+    fields = {
+        'bisaya': bisaya_col,
+        'tagalog': text_column(df, 'Tagalog'),
+        'english': text_column(df, 'English', missing='nan'),  # as str(NaN) gave before
+        'pronunciation': text_column(df, 'Pronunciation'),
+        'pos': text_column(df, 'Part of Speech'),
+    }
+    # Add example columns if they exist in the dataset
+    for example_column, example_fields in EXAMPLE_FIELDS:
+        if example_column in df.columns:
+            for key, column in example_fields:
+                fields[key] = text_column(df, column)
+    
+    # Keep rows with a Bisaya word; their metadata dicts come out of a single to_dict() call
+    has_bisaya = bisaya_col.ne('') & bisaya_col.ne('nan')
+    metadata_list = pd.DataFrame(fields)[has_bisaya].to_dict(orient='records')
+    
+    # Index of each word's row in the embedding matrix is its position among the kept rows
+    for idx, bisaya_lower in enumerate(bisaya_col[has_bisaya].str.lower().tolist()):
+        # Get or create embedding (rows with no in-vocab words stay zero)
+        if bisaya_lower in vocab:
+            hit_rows.append(idx)
+            hit_ids.append(vocab[bisaya_lower])
+        else:
+            word_ids = np.fromiter((vocab[w] for w in bisaya_lower.split() if w in vocab), dtype=np.intp)
+            if word_ids.size:
+                phrase_embeddings[idx] = mean_embedding(word_ids, vectors)
+        
+        word_to_index[bisaya_lower] = idx
+        index_to_word[idx] = bisaya_lower
     
     # Create TensorFlow model
-    vocab_size = len(embeddings_list)
+    vocab_size = len(metadata_list)
     embedding_dim = 100
     
-    # Create embedding layer
-    embedding_matrix = np.array(embeddings_list)
+    # Create embedding layer: one gather for whole-word rows, then the phrase means
+    embedding_matrix = np.zeros((vocab_size, embedding_dim), dtype=vectors.dtype)
+    embedding_matrix[hit_rows] = vectors[np.asarray(hit_ids, dtype=np.intp)]
+    for idx, embedding in phrase_embeddings.items():
+        embedding_matrix[idx] = embedding
     
     # Simple model: Input word index -> Output embedding
     input_layer = tf.keras.layers.Input(shape=(1,), dtype=tf.int32, name='word_index')
@@ -194,12 +256,41 @@ def create_embedding_model(word2vec_model, df):
     
     return model, word_to_index, index_to_word, metadata_list
 
-def convert_to_tflite(model, output_path):
-    """Convert TensorFlow model to TensorFlow Lite format"""
-    print("🔄 Converting to TensorFlow Lite...")
+# Extra TFLite builds written next to bisaya_model.tflite (the dynamic-range model the app loads)
+TFLITE_VARIANTS = {
+    # float16 weights: GPU delegate friendly, near-lossless; the app loads it with
+    # loadModel(modelAsset: NLPModelService.fp16ModelAsset)
+    'fp16': 'bisaya_model_fp16.tflite',
+}
+# Full-integer build, only on request: one int8 scale for the whole embedding table loses accuracy
+INT8_VARIANT = 'bisaya_model_int8.tflite'
+
+def convert_to_tflite(model, output_path, vocab_size, mode='dynamic'):
+    """Convert TensorFlow model to TensorFlow Lite format
+    
+    mode: 'dynamic' (dynamic-range int8 weights, float kernels), 'fp16' (float16 weights)
+    or 'int8' (full integer kernels)
+    """
+    print(f"🔄 Converting to TensorFlow Lite ({mode})...")
     
     converter = tf.lite.TFLiteConverter.from_keras_model(model)
     converter.optimizations = [tf.lite.Optimize.DEFAULT]
+    
+    if mode == 'int8':
+        # Calibrate on every word index so the int8 scale covers the whole embedding table
+        def representative_dataset():
+            for i in range(vocab_size):
+                yield [np.array([[i]], dtype=np.int32)]
+        
+        converter.representative_dataset = representative_dataset
+        converter.target_spec.supported_ops = [tf.lite.OpsSet.TFLITE_BUILTINS_INT8]
+        # inference_input_type/output_type stay as they are: the app feeds an int32 word
+        # index (often > 127) and reads a float32 vector, so the model dequantizes its output
+    elif mode == 'fp16':
+        converter.target_spec.supported_types = [tf.float16]
+    elif mode != 'dynamic':
+        raise ValueError(f"Unknown TFLite conversion mode: {mode}")
+    
     tflite_model = converter.convert()
     
     with open(output_path, 'wb') as f:
@@ -209,6 +300,28 @@ def convert_to_tflite(model, output_path):
     print(f"✅ TensorFlow Lite model saved: {output_path}")
     print(f"📦 File size: {file_size_kb:.2f} KB")
 
+def json_dumps(value):
+    """Compact UTF-8 JSON bytes (int keys such as index_to_word's become strings)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+# Raw embedding table for direct lookup in the app: row-major int8 values plus one
+# little-endian float32 scale per row (value = int8 * scale), no TFLite interpreter needed
+EMBEDDING_TABLE_FILES = ('bisaya_embeddings.bin', 'bisaya_embedding_scales.bin')
+
+def save_embedding_table(embedding_model, embeddings_path, scales_path):
+    """Save the embedding layer's weights as per-row symmetric int8 plus float32 scales"""
+    embedding_matrix = embedding_model.get_layer('word_embeddings').get_weights()[0]
+    scales = np.abs(embedding_matrix).max(axis=1) / 127
+    scales[scales == 0] = 1  # All-zero rows (phrases with no known words) quantize to zeros
+    quantized = np.round(embedding_matrix / scales[:, None]).astype(np.int8)
+    quantized.tofile(embeddings_path)
+    scales.astype('<f4').tofile(scales_path)
+    
+    table_size_kb = (os.path.getsize(embeddings_path) + os.path.getsize(scales_path)) / 1024
+    print(f"✅ Embedding table saved: {embeddings_path} ({table_size_kb:.2f} KB with scales)")
+
 def save_metadata(word_to_index, index_to_word, metadata_list, output_path):
     """Save metadata (vocabulary, translations, etc.) as JSON"""
     metadata = {
@@ -220,45 +333,155 @@ def save_metadata(word_to_index, index_to_word, metadata_list, output_path):
         'version': '1.0.0'
     }
     
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(metadata, f, ensure_ascii=False, indent=2)
+    with open(output_path, 'wb') as f:
+        f.write(json_dumps(metadata))
     
     print(f"✅ Metadata saved: {output_path}")
 
-def calculate_similarity_matrix(word2vec_model, df):
-    """Pre-compute similarity matrix for fast lookup"""
+# Rows scored per step, so only a block x V slice of the similarity matrix exists at a time
+SIMILARITY_BLOCK_ROWS = 1024
+# GPU memory is plentiful on Colab runtimes, so bigger blocks keep cuBLAS busy
+GPU_SIMILARITY_BLOCK_ROWS = 8192
+
+def similarity_block(embedding_matrix, start, stop):
+    """Cosine similarities of rows start:stop against every row of a unit-row matrix"""
+    block = embedding_matrix[start:stop]
+    if SIMSIMD_AVAILABLE:
+        # SIMD cosine-distance kernels straight over the rows, no SGEMM
+        return 1.0 - np.asarray(simsimd.cdist(block, embedding_matrix, metric='cosine'), dtype=np.float32)
+    return block @ embedding_matrix.T
+
+if NUMBA_AVAILABLE:
+    # Every fast-math flag except nnan/ninf: the kept scores start at -inf, and under ninf
+    # comparing against that seed would be undefined
+    @njit(parallel=True, fastmath={'nsz', 'arcp', 'contract', 'afn', 'reassoc'}, cache=True)
+    def topk_cosine(E, k, out_idx, out_score):
+        """Top-k dot products of each unit row of E against all others, without a V x V matrix"""
+        V, D = E.shape
+        for i in prange(V):
+            scores = out_score[i]
+            idx = out_idx[i]
+            scores[:] = -np.inf
+            idx[:] = -1
+            worst = 0
+            for j in range(V):
+                if j == i:
+                    continue
+                s = 0.0
+                for d in range(D):
+                    s += E[i, d] * E[j, d]
+                if s > scores[worst]:
+                    # Replace the current lowest of the k kept scores
+                    scores[worst] = s
+                    idx[worst] = j
+                    worst = 0
+                    for m in range(1, k):
+                        if scores[m] < scores[worst]:
+                            worst = m
+            # Order the k kept scores from most to least similar (k is small)
+            for m in range(1, k):
+                s = scores[m]
+                j = idx[m]
+                n = m - 1
+                while n >= 0 and scores[n] < s:
+                    scores[n + 1] = scores[n]
+                    idx[n + 1] = idx[n]
+                    n -= 1
+                scores[n + 1] = s
+                idx[n + 1] = j
+
+def top_k_similar_gpu(embedding_matrix, k):
+    """Unsorted top-k indices and scores per row, scored block by block with cuBLAS on the GPU"""
+    X = cp.asarray(embedding_matrix, dtype=cp.float32)
+    top_idx = np.empty((len(embedding_matrix), k), dtype=np.intp)
+    top_scores = np.empty((len(embedding_matrix), k), dtype=np.float32)
+    for start in range(0, len(embedding_matrix), GPU_SIMILARITY_BLOCK_ROWS):
+        stop = min(start + GPU_SIMILARITY_BLOCK_ROWS, len(embedding_matrix))
+        similarity_rows = X[start:stop] @ X.T
+        rows = cp.arange(stop - start)
+        similarity_rows[rows, rows + start] = -cp.inf  # Don't include self-similarity
+        block_idx = cp.argpartition(similarity_rows, -k, axis=1)[:, -k:]
+        # Only the k winners per row go back to the host
+        top_idx[start:stop] = block_idx.get()
+        top_scores[start:stop] = cp.take_along_axis(similarity_rows, block_idx, axis=1).get()
+    return top_idx, top_scores
+
+def top_k_similar(embedding_matrix, k):
+    """Indices and scores of the k most similar rows for every row of unit vectors, best first"""
+    if CUPY_AVAILABLE:
+        top_idx, top_scores = top_k_similar_gpu(embedding_matrix, k)
+        order = np.argsort(-top_scores, axis=1)
+        return np.take_along_axis(top_idx, order, axis=1), np.take_along_axis(top_scores, order, axis=1)
+    
+    if NUMBA_AVAILABLE:
+        # One parallel pass keeping a running top-k per row, so no similarity rows are materialized
+        top_idx = np.empty((len(embedding_matrix), k), dtype=np.int32)
+        top_scores = np.empty((len(embedding_matrix), k), dtype=np.float32)
+        topk_cosine(embedding_matrix, k, top_idx, top_scores)
+        return top_idx, top_scores
+    
+    # Partition out each row's top k block by block, then sort just those
+    top_idx = np.empty((len(embedding_matrix), k), dtype=np.intp)
+    top_scores = np.empty((len(embedding_matrix), k), dtype=np.float32)
+    for start in range(0, len(embedding_matrix), SIMILARITY_BLOCK_ROWS):
+        stop = min(start + SIMILARITY_BLOCK_ROWS, len(embedding_matrix))
+        similarity_rows = similarity_block(embedding_matrix, start, stop)
+        rows = np.arange(stop - start)
+        similarity_rows[rows, rows + start] = -np.inf  # Don't include self-similarity
+        block_idx = np.argpartition(similarity_rows, -k, axis=1)[:, -k:]
+        top_idx[start:stop] = block_idx
+        top_scores[start:stop] = np.take_along_axis(similarity_rows, block_idx, axis=1)
+    order = np.argsort(-top_scores, axis=1)
+    return np.take_along_axis(top_idx, order, axis=1), np.take_along_axis(top_scores, order, axis=1)
+
+def calculate_similarity_matrix(word2vec_model, bisaya_words):
+    """Pre-compute the top similar words as (words, top_idx, top_scores) arrays
+    
+    bisaya_words: the cleaned, lower-cased Bisaya words in row order (index_to_word's values)
+    """
     print("🔄 Calculating similarity matrix...")
     
+    vocab = word2vec_model.wv.key_to_index
     words = []
-    embeddings = []
-    
-    for _, row in df.iterrows():
-        bisaya = str(row['Bisaya']).strip()
-        if bisaya and bisaya != 'nan':
-            bisaya_lower = bisaya.lower()
-            if bisaya_lower in word2vec_model.wv:
-                words.append(bisaya_lower)
-                embeddings.append(word2vec_model.wv[bisaya_lower])
-    
-    if not embeddings:
-        return {}
-    
-    embedding_matrix = np.array(embeddings)
-    similarity_matrix = cosine_similarity(embedding_matrix)
-    
-    # Create top similar words dictionary
-    top_similar = {}
-    for i, word in enumerate(words):
-        similarities = []
-        for j, other_word in enumerate(words):
-            if i != j:
-                similarities.append((other_word, float(similarity_matrix[i][j])))
-        similarities.sort(key=lambda x: x[1], reverse=True)
-        top_similar[word] = {w: s for w, s in similarities[:10]}
-    
-    return top_similar
+    word_ids = []
+    
+    for bisaya_lower in bisaya_words:
+        if bisaya_lower in vocab:
+            words.append(bisaya_lower)
+            word_ids.append(vocab[bisaya_lower])
+    
+    # Normalize once; cosine similarity is then a plain dot product (float32, as stored by Word2Vec).
+    # Fancy indexing gathers all rows in one go and returns a copy, so normalizing in place is safe
+    embedding_matrix = word2vec_model.wv.vectors[np.asarray(word_ids, dtype=np.intp)].astype(np.float32, copy=False)
+    embedding_matrix /= np.maximum(np.linalg.norm(embedding_matrix, axis=1, keepdims=True), 1e-12)
+    
+    # Each word's 10 nearest neighbours (with fewer than two words, k = 0 gives empty rows)
+    k = max(0, min(10, len(words) - 1))
+    if k == 0:
+        return words, np.empty((len(words), 0), dtype=np.int32), np.empty((len(words), 0), dtype=np.float32)
+    top_idx, top_scores = top_k_similar(embedding_matrix, k)
+    return words, top_idx, top_scores
+
+def similarity_rows(words, top_idx, top_scores):
+    """(word, {similar_word: score}) pairs from the top-k arrays, one row at a time"""
+    # A word listed on several rows keeps its last row, as a dict built from all rows would
+    last_row = {word: i for i, word in enumerate(words)}
+    for i, (word, idx_row, score_row) in enumerate(zip(words, top_idx, top_scores)):
+        if last_row[word] == i:
+            # Two decimals is about int8 resolution (1/127) and all the app needs to rank and
+            # threshold similar words, while keeping the shipped JSON asset small
+            yield word, {words[j]: round(s, 2) for j, s in zip(idx_row.tolist(), score_row.tolist())}
+
+def write_json_object(f, items):
+    """Write (key, value) pairs as a JSON object, encoding one entry at a time"""
+    f.write(b'{')
+    for i, (key, value) in enumerate(items):
+        if i:
+            f.write(b',')
+        f.write(json_dumps(key) + b':' + json_dumps(value))
+    f.write(b'}')
 
-def save_files_to_drive(tflite_path, metadata_path, similarity_path, drive_folder_path):
+def save_files_to_drive(tflite_path, metadata_path, similarity_path, drive_folder_path, extra_paths=None):
     """Save all model files to Google Drive folder"""
     print(f"\n💾 Saving model files to Google Drive folder: {drive_folder_path}")
     
@@ -270,6 +493,8 @@ def save_files_to_drive(tflite_path, metadata_path, similarity_path, drive_folde
         'bisaya_metadata.json': metadata_path,
         'bisaya_similarity.json': similarity_path,
     }
+    # Extra TFLite builds and the raw embedding table, keyed by file name
+    files_to_save.update(extra_paths or {})
     
     for filename, source_path in files_to_save.items():
         dest_path = f'{drive_folder_path}/{filename}'
@@ -281,17 +506,19 @@ def save_files_to_drive(tflite_path, metadata_path, similarity_path, drive_folde
     print(f"📁 Location: {drive_folder_path}")
     print("\n📋 Next steps:")
     print("1. Open Google Drive and navigate to the 'AAA' folder")
-    print("2. Download the 3 model files to your computer")
+    print(f"2. Download the {len(files_to_save)} model files to your computer")
     print("3. Copy them to: assets/models/ in your Flutter project")
     print("4. Make sure pubspec.yaml includes: assets/models/")
 
-def main(folder_name='AAA'):
+def main(folder_name='AAA', include_int8=False):
     """
     Main training function
     
     Args:
         folder_name: Name of the Google Drive folder containing the CSV
                     (default: 'AAA')
+        include_int8: Also build the full-integer bisaya_model_int8.tflite
+                    (default: False)
     """
     print("=" * 60)
     print("🚀 Bisaya NLP Model Training for TensorFlow Lite")
@@ -322,7 +549,8 @@ def main(folder_name='AAA'):
     
     # Step 4: Train Word2Vec
     print("\nStep 4: Training Word2Vec embeddings...")
-    word2vec_model = train_embeddings(training_data)
+    # Cached next to the dataset in Drive, so re-runs in a fresh runtime skip training too
+    word2vec_model = load_or_train_embeddings(training_data, f'{drive_folder_path}/.cache')
     
     # Step 5: Create TensorFlow model
     print("\nStep 5: Creating TensorFlow model...")
@@ -331,7 +559,13 @@ def main(folder_name='AAA'):
     # Step 6: Convert to TensorFlow Lite (save to temp location first)
     print("\nStep 6: Converting to TensorFlow Lite...")
     temp_tflite_path = '/content/bisaya_model.tflite'
-    convert_to_tflite(embedding_model, temp_tflite_path)
+    convert_to_tflite(embedding_model, temp_tflite_path, len(metadata_list))
+    variants = {**TFLITE_VARIANTS, **({'int8': INT8_VARIANT} if include_int8 else {})}
+    temp_variant_paths = {filename: f'/content/{filename}' for filename in variants.values()}
+    for mode, filename in variants.items():
+        convert_to_tflite(embedding_model, temp_variant_paths[filename], len(metadata_list), mode=mode)
+    temp_table_paths = {filename: f'/content/{filename}' for filename in EMBEDDING_TABLE_FILES}
+    save_embedding_table(embedding_model, *temp_table_paths.values())
     
     # Step 7: Save metadata (save to temp location first)
     print("\nStep 7: Saving metadata...")
@@ -340,15 +574,17 @@ def main(folder_name='AAA'):
     
     # Step 8: Calculate similarity matrix (save to temp location first)
     print("\nStep 8: Calculating similarity matrix...")
-    similarity = calculate_similarity_matrix(word2vec_model, df)
+    # Reuse the words create_embedding_model already cleaned instead of walking df again
+    similarity = calculate_similarity_matrix(word2vec_model, list(index_to_word.values()))
     temp_similarity_path = '/content/bisaya_similarity.json'
-    with open(temp_similarity_path, 'w', encoding='utf-8') as f:
-        json.dump(similarity, f, ensure_ascii=False, indent=2)
+    with open(temp_similarity_path, 'wb') as f:
+        # Stream one word's entry at a time instead of building the whole dict first
+        write_json_object(f, similarity_rows(*similarity))
     print(f"✅ Similarity matrix saved: {temp_similarity_path}")
     
     # Step 9: Save files to Google Drive
     print("\n" + "=" * 60)
-    save_files_to_drive(temp_tflite_path, temp_metadata_path, temp_similarity_path, drive_folder_path)
+    save_files_to_drive(temp_tflite_path, temp_metadata_path, temp_similarity_path, drive_folder_path, {**temp_variant_paths, **temp_table_paths})
     
     print("\n" + "=" * 60)
     print("✅ Model training completed successfully!")
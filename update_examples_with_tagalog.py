@@ -2,13 +2,31 @@
 """
 Helper script to update all examples in regenerate_dataset.py to include Tagalog translations.
 This updates the remaining examples that don't have Tagalog yet.
+
+The committed regenerate_dataset.py is already converted; run with --check to verify
+that no old-style example has crept back in (exits 1 if one has). Other files to convert
+or check can be passed as arguments; several are processed in parallel.
 """
 
+import mmap
+import os
 import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+
+SOURCE_PATH = 'regenerate_dataset.py'
+WRITE_BUFFER_SIZE = 1 << 20  # Rewritten file goes out in few large write() calls
+
+
+def contains_any(path, pattern):
+    """Whether a bytes pattern matches anywhere in the file, searched over an mmap (no decoding or copy)"""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return False
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return pattern.search(mm) is not None
 
-# Read the file
-with open('regenerate_dataset.py', 'r', encoding='utf-8') as f:
-    content = f.read()
 
 # Common Tagalog translations for verbs
 verb_translations = {
@@ -22,71 +40,149 @@ verb_translations = {
     'go': 'pumunta',
 }
 
-# Update verb examples
+# Update verb examples: (literal old example, replacement with Tagalog)
 verb_patterns = [
-    (r"beginner = 'Gusto ko mokaon\. -> \"I want to eat\.\"'", 
+    ("beginner = 'Gusto ko mokaon. -> \"I want to eat.\"'",
      "beginner = make_example('Gusto ko mokaon.', 'I want to eat.', 'Gusto kong kumain.')"),
-    (r"intermediate = 'Nakaon na ba ka\? -> \"Have you eaten already\?\"'",
+    ("intermediate = 'Nakaon na ba ka? -> \"Have you eaten already?\"'",
      "intermediate = make_example('Nakaon na ba ka?', 'Have you eaten already?', 'Kumain ka na ba?')"),
-    (r"advanced = 'Gikaon nako ang tinapay ganina\. -> \"I ate the bread earlier\.\"'",
+    ("advanced = 'Gikaon nako ang tinapay ganina. -> \"I ate the bread earlier.\"'",
      "advanced = make_example('Gikaon nako ang tinapay ganina.', 'I ate the bread earlier.', 'Kumain ako ng tinapay kanina.')"),
     
-    (r"beginner = 'Gusto ko matulog\. -> \"I want to sleep\.\"'",
+    ("beginner = 'Gusto ko matulog. -> \"I want to sleep.\"'",
      "beginner = make_example('Gusto ko matulog.', 'I want to sleep.', 'Gusto kong matulog.')"),
-    (r"intermediate = 'Natulog na ba ka\? -> \"Have you slept already\?\"'",
+    ("intermediate = 'Natulog na ba ka? -> \"Have you slept already?\"'",
      "intermediate = make_example('Natulog na ba ka?', 'Have you slept already?', 'Natulog ka na ba?')"),
-    (r"advanced = 'Kinahanglan nga matulog ka aron makapahuway\. -> \"You need to sleep to rest\.\"'",
+    ("advanced = 'Kinahanglan nga matulog ka aron makapahuway. -> \"You need to sleep to rest.\"'",
      "advanced = make_example('Kinahanglan nga matulog ka aron makapahuway.', 'You need to sleep to rest.', 'Kailangan mong matulog para makapahinga.')"),
     
-    (r"beginner = 'Gusto ko mobasa\. -> \"I want to read\.\"'",
+    ("beginner = 'Gusto ko mobasa. -> \"I want to read.\"'",
      "beginner = make_example('Gusto ko mobasa.', 'I want to read.', 'Gusto kong magbasa.')"),
-    (r"intermediate = 'Nagbasa ko ug libro\. -> \"I am reading a book\.\"'",
+    ("intermediate = 'Nagbasa ko ug libro. -> \"I am reading a book.\"'",
      "intermediate = make_example('Nagbasa ko ug libro.', 'I am reading a book.', 'Nagbabasa ako ng libro.')"),
-    (r"advanced = 'Gibasa nako ang libro ganina\. -> \"I read the book earlier\.\"'",
+    ("advanced = 'Gibasa nako ang libro ganina. -> \"I read the book earlier.\"'",
      "advanced = make_example('Gibasa nako ang libro ganina.', 'I read the book earlier.', 'Binasa ko ang libro kanina.')"),
     
-    (r"beginner = 'Gusto ko mosulat\. -> \"I want to write\.\"'",
+    ("beginner = 'Gusto ko mosulat. -> \"I want to write.\"'",
      "beginner = make_example('Gusto ko mosulat.', 'I want to write.', 'Gusto kong sumulat.')"),
-    (r"intermediate = 'Nagsulat ko ug sulat\. -> \"I am writing a letter\.\"'",
+    ("intermediate = 'Nagsulat ko ug sulat. -> \"I am writing a letter.\"'",
      "intermediate = make_example('Nagsulat ko ug sulat.', 'I am writing a letter.', 'Nagsusulat ako ng sulat.')"),
-    (r"advanced = 'Gisulat nako ang sulat kagahapon\. -> \"I wrote the letter yesterday\.\"'",
+    ("advanced = 'Gisulat nako ang sulat kagahapon. -> \"I wrote the letter yesterday.\"'",
      "advanced = make_example('Gisulat nako ang sulat kagahapon.', 'I wrote the letter yesterday.', 'Sinulat ko ang sulat kahapon.')"),
     
-    (r"beginner = 'Gusto ko mopalit\. -> \"I want to buy\.\"'",
+    ("beginner = 'Gusto ko mopalit. -> \"I want to buy.\"'",
      "beginner = make_example('Gusto ko mopalit.', 'I want to buy.', 'Gusto kong bumili.')"),
-    (r"intermediate = 'Mopalit ko ug tinapay\. -> \"I will buy bread\.\"'",
+    ("intermediate = 'Mopalit ko ug tinapay. -> \"I will buy bread.\"'",
      "intermediate = make_example('Mopalit ko ug tinapay.', 'I will buy bread.', 'Bibili ako ng tinapay.')"),
-    (r"advanced = 'Gipalit nako ang tinapay sa tindahan\. -> \"I bought the bread at the store\.\"'",
+    ("advanced = 'Gipalit nako ang tinapay sa tindahan. -> \"I bought the bread at the store.\"'",
      "advanced = make_example('Gipalit nako ang tinapay sa tindahan.', 'I bought the bread at the store.', 'Binili ko ang tinapay sa tindahan.')"),
     
-    (r"beginner = 'Gusto ko molakaw\. -> \"I want to walk\.\"'",
+    ("beginner = 'Gusto ko molakaw. -> \"I want to walk.\"'",
      "beginner = make_example('Gusto ko molakaw.', 'I want to walk.', 'Gusto kong maglakad.')"),
-    (r"intermediate = 'Naglakaw ko sa dalan\. -> \"I am walking on the road\.\"'",
+    ("intermediate = 'Naglakaw ko sa dalan. -> \"I am walking on the road.\"'",
      "intermediate = make_example('Naglakaw ko sa dalan.', 'I am walking on the road.', 'Naglalakad ako sa kalsada.')"),
-    (r"advanced = 'Naglakaw ko gikan sa balay padulong sa eskwelahan\. -> \"I walked from home to school\.\"'",
+    ("advanced = 'Naglakaw ko gikan sa balay padulong sa eskwelahan. -> \"I walked from home to school.\"'",
      "advanced = make_example('Naglakaw ko gikan sa balay padulong sa eskwelahan.', 'I walked from home to school.', 'Naglalakad ako mula sa bahay papunta sa paaralan.')"),
     
-    (r"beginner = 'Gusto ko modagan\. -> \"I want to run\.\"'",
+    ("beginner = 'Gusto ko modagan. -> \"I want to run.\"'",
      "beginner = make_example('Gusto ko modagan.', 'I want to run.', 'Gusto kong tumakbo.')"),
-    (r"intermediate = 'Nagdagan ko sa parke\. -> \"I am running in the park\.\"'",
+    ("intermediate = 'Nagdagan ko sa parke. -> \"I am running in the park.\"'",
      "intermediate = make_example('Nagdagan ko sa parke.', 'I am running in the park.', 'Tumatakbo ako sa parke.')"),
-    (r"advanced = 'Nagdagan ko aron makab-ot ang bus\. -> \"I ran to catch the bus\.\"'",
+    ("advanced = 'Nagdagan ko aron makab-ot ang bus. -> \"I ran to catch the bus.\"'",
      "advanced = make_example('Nagdagan ko aron makab-ot ang bus.', 'I ran to catch the bus.', 'Tumakbo ako para mahabol ang bus.')"),
     
-    (r"beginner = 'Moadto ko\. -> \"I will go\.\"'",
+    ("beginner = 'Moadto ko. -> \"I will go.\"'",
      "beginner = make_example('Moadto ko.', 'I will go.', 'Pupunta ako.')"),
-    (r"intermediate = 'Moadto ko sa balay\. -> \"I will go to the house\.\"'",
+    ("intermediate = 'Moadto ko sa balay. -> \"I will go to the house.\"'",
      "intermediate = make_example('Moadto ko sa balay.', 'I will go to the house.', 'Pupunta ako sa bahay.')"),
-    (r"advanced = 'Moadto ko sa balay sa akong higala\. -> \"I will go to my friend\'s house\.\"'",
+    ("advanced = 'Moadto ko sa balay sa akong higala. -> \"I will go to my friend's house.\"'",
      "advanced = make_example('Moadto ko sa balay sa akong higala.', 'I will go to my friend\'s house.', 'Pupunta ako sa bahay ng aking kaibigan.')"),
 ]
 
-for pattern, replacement in verb_patterns:
-    content = re.sub(pattern, replacement, content)
+# All needles fused into one alternation over their UTF-8 bytes, so checking a file for any
+# old example is a single scan that stops at the first hit instead of one find() per needle
+needle_scan = re.compile(b'|'.join(re.escape(needle.encode('utf-8')) for needle, _ in verb_patterns))
+
+# Every pattern is a literal line, so plain str.replace does the job without the regex engine.
+# Every needle starts with "beginner = '", "intermediate = '" or "advanced = '"; bucket them
+# by that prefix so a line is only checked against the needles it could contain
+pattern_buckets = {}
+for needle, replacement in verb_patterns:
+    prefix = needle[:needle.index("'") + 1]
+    pattern_buckets.setdefault(prefix, []).append((needle, replacement))
+
+# Most example lines are exactly one old example plus indentation; a dict probe on the
+# stripped line rewrites those without scanning for any needle
+line_map = dict(verb_patterns)
+# Their first 8 characters ('beginner', 'intermed', 'advanced'): comparing those short slices
+# filters out most lines before hashing the whole stripped line for the line_map probe
+line_heads = frozenset(needle[:8] for needle in line_map)
+
+
+def rewrite_needles(line):
+    for prefix, bucket in pattern_buckets.items():
+        if prefix in line:
+            for needle, replacement in bucket:
+                line = line.replace(needle, replacement)
+    return line
+
+
+def rewrite_line(line):
+    body = line.strip()
+    if body[:8] in line_heads and body in line_map:
+        indent = len(line) - len(line.lstrip())
+        return line[:indent] + line_map[body] + line[indent + len(body):]
+    return rewrite_needles(line)
+
+
+def rewrite_file(path):
+    """Rewrite one file's old examples in place; returns whether it had any"""
+    # Nothing to rewrite once every example has been converted: leave the file (and its mtime) alone
+    if not contains_any(path, needle_scan):
+        return False
+
+    # No example spans lines, so rewrite the file a line at a time into a temp file,
+    # then swap it in (the original is untouched if anything fails midway)
+    # Binary I/O: no newline translation (line endings are kept as they are) and unchanged
+    # lines are copied back as their original bytes, so only rewritten lines get encoded
+    temp_path = path + '.tmp'
+    with open(path, 'rb') as src, open(temp_path, 'wb', buffering=WRITE_BUFFER_SIZE) as dst:
+        for raw_line in src:
+            line = raw_line.decode('utf-8')
+            new_line = rewrite_line(line)
+            dst.write(raw_line if new_line == line else new_line.encode('utf-8'))
+    os.replace(temp_path, path)
+    return True
+
+
+def main(argv):
+    """Convert the given files (default: regenerate_dataset.py), or only check them with --check"""
+    paths = [arg for arg in argv if arg != '--check'] or [SOURCE_PATH]
+
+    # regenerate_dataset.py is committed already converted, so CI only needs to check it stays that way
+    if '--check' in argv:
+        stale = [path for path in paths if contains_any(path, needle_scan)]
+        for path in stale:
+            print(f"❌ {path} has verb examples without Tagalog; run update_examples_with_tagalog.py")
+        if stale:
+            sys.exit(1)
+        print("✅ Verb examples already include Tagalog")
+        return
+
+    # Files are independent, so a batch is spread over one process per core
+    if len(paths) > 1:
+        with ProcessPoolExecutor(max_workers=min(len(paths), os.cpu_count() or 1)) as executor:
+            updated = list(executor.map(rewrite_file, paths))
+    else:
+        updated = [rewrite_file(paths[0])]
 
-# Write back
-with open('regenerate_dataset.py', 'w', encoding='utf-8') as f:
-    f.write(content)
+    for path, was_updated in zip(paths, updated):
+        where = f" in {path}" if len(paths) > 1 else ""
+        if was_updated:
+            print(f"✅ Updated verb examples with Tagalog{where}")
+        else:
+            print(f"✅ Verb examples already include Tagalog{where}")
 
-print("✅ Updated verb examples with Tagalog")
 
+if __name__ == '__main__':
+    main(sys.argv[1:])